@@ -14,68 +14,73 @@ from datarack import DataRack
 
 
 def main():
-    print("=" * 60)
-    print("Multi-Tile DataRack Placement Example")
-    print("=" * 60)
+    # Collect all output lines and write them once at the end
+    out = []
+    out.append("=" * 60)
+    out.append("Multi-Tile DataRack Placement Example")
+    out.append("=" * 60)
     
     # Create a 10x10 tile room
     room = Room(room_id="DC-MAIN", num_tiles_x=10, num_tiles_y=10, height=3.0)
-    print(f"\nCreated room: {room.room_id}")
-    print(f"  Dimensions: {room.num_tiles_x}x{room.num_tiles_y} tiles")
-    print(f"  Physical size: {room.length}m x {room.width}m x {room.height}m")
-    print(f"  Total area: {room.area:.2f} m²")
+    out.append(f"\nCreated room: {room.room_id}")
+    out.append(f"  Dimensions: {room.num_tiles_x}x{room.num_tiles_y} tiles")
+    out.append(f"  Physical size: {room.length}m x {room.width}m x {room.height}m")
+    out.append(f"  Total area: {room.area:.2f} m²")
     
-    # Place a standard 2x2 rack
-    print("\n" + "-" * 60)
-    rack1 = DataRack("RACK-01", 2, 2, 42, width_tiles=2, depth_tiles=2)
-    result1 = room.add_data_rack(rack1)
-    print(f"Placing {rack1}")
-    print(f"  Success: {result1}")
-    print(f"  Tiles occupied: {rack1.get_tile_footprint()}")
+    # Place five racks in a single batch: a standard 2x2 rack, a large 3x2 rack,
+    # an overlapping rack and an out-of-bounds rack (both should fail), and a single-tile rack
+    racks = [
+        DataRack("RACK-01", 2, 2, 42, width_tiles=2, depth_tiles=2),
+        DataRack("RACK-02", 5, 3, 45, width_tiles=3, depth_tiles=2),
+        DataRack("RACK-03", 3, 3, 40, width_tiles=2, depth_tiles=2),
+        DataRack("RACK-04", 9, 9, 40, width_tiles=2, depth_tiles=2),
+        DataRack("RACK-05", 0, 0, 20, width_tiles=1, depth_tiles=1),
+    ]
+    expected_failures = {
+        "RACK-03": "overlaps with RACK-01",
+        "RACK-04": "out of bounds",
+    }
+    results = room.add_data_racks(racks)
     
-    # Place a large 3x2 rack
-    print("\n" + "-" * 60)
-    rack2 = DataRack("RACK-02", 5, 3, 45, width_tiles=3, depth_tiles=2)
-    result2 = room.add_data_rack(rack2)
-    print(f"Placing {rack2}")
-    print(f"  Success: {result2}")
-    print(f"  Tiles occupied: {rack2.get_tile_footprint()}")
+    for rack, result in zip(racks, results):
+        out.append("\n" + "-" * 60)
+        if rack.rack_id in expected_failures:
+            out.append(f"Attempting to place {rack}")
+            out.append(f"  Success: {result} (Expected False - {expected_failures[rack.rack_id]})")
+        else:
+            out.append(f"Placing {rack}")
+            out.append(f"  Success: {result}")
+            out.append(f"  Tiles occupied: {rack.get_tile_footprint()}")
     
-    # Try to place an overlapping rack (should fail)
-    print("\n" + "-" * 60)
-    rack3 = DataRack("RACK-03", 3, 3, 40, width_tiles=2, depth_tiles=2)
-    result3 = room.add_data_rack(rack3)
-    print(f"Attempting to place {rack3}")
-    print(f"  Success: {result3} (Expected False - overlaps with RACK-01)")
-    
-    # Try to place a rack out of bounds (should fail)
-    print("\n" + "-" * 60)
-    rack4 = DataRack("RACK-04", 9, 9, 40, width_tiles=2, depth_tiles=2)
-    result4 = room.add_data_rack(rack4)
-    print(f"Attempting to place {rack4}")
-    print(f"  Success: {result4} (Expected False - out of bounds)")
-    
-    # Place a single-tile rack
-    print("\n" + "-" * 60)
-    rack5 = DataRack("RACK-05", 0, 0, 20, width_tiles=1, depth_tiles=1)
-    result5 = room.add_data_rack(rack5)
-    print(f"Placing {rack5}")
-    print(f"  Success: {result5}")
-    print(f"  Tiles occupied: {rack5.get_tile_footprint()}")
+    # Let the room find a free spot for a 3x3 rack
+    out.append("\n" + "-" * 60)
+    free_position = room.find_free_placement(3, 3)
+    if free_position is None:
+        out.append("No free 3x3 position left for RACK-06")
+    else:
+        free_x, free_y = free_position
+        rack6 = DataRack("RACK-06", free_x, free_y, 42, width_tiles=3, depth_tiles=3)
+        result6 = room.add_data_rack(rack6)
+        out.append(f"First free 3x3 position: ({free_x}, {free_y})")
+        out.append(f"Placing {rack6}")
+        out.append(f"  Success: {result6}")
+        out.append(f"  Tiles occupied: {rack6.get_tile_footprint()}")
     
     # Summary
-    print("\n" + "=" * 60)
-    print("Room Summary")
-    print("=" * 60)
-    print(f"Total racks placed: {len(room.data_racks)}")
-    print(f"Occupied tiles: {len(room.get_occupied_tiles())} / {room.num_tiles_x * room.num_tiles_y}")
-    print(f"Unoccupied tiles: {len(room.get_unoccupied_tiles())}")
+    out.append("\n" + "=" * 60)
+    out.append("Room Summary")
+    out.append("=" * 60)
+    out.append(f"Total racks placed: {len(room.data_racks)}")
+    out.append(f"Occupied tiles: {room.occupied_tile_count} / {room.num_tiles_x * room.num_tiles_y}")
+    out.append(f"Unoccupied tiles: {len(room.get_unoccupied_tiles())}")
     
-    print("\nRack Details:")
+    out.append("\nRack Details:")
     for rack in room.data_racks:
         info = rack.get_rack_info()
-        print(f"  {info['rack_id']}: {info['width_tiles']}x{info['depth_tiles']} tiles, "
-              f"{info['rack_units']}U, {info['rack_height_meters']:.2f}m tall")
+        out.append(f"  {info['rack_id']}: {info['width_tiles']}x{info['depth_tiles']} tiles, "
+                   f"{info['rack_units']}U, {info['rack_height_meters']:.2f}m tall")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -20,12 +20,19 @@ import sys
 import os
 sys.path.insert(0, 'src')
 
+import json
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 from room import Room
 from datarack import DataRack
 from ladder import Ladder, Section
 from obstacle import Obstacle
-import math
+
+try:
+    import orjson  # Optional: much faster JSON encoding/decoding for large layouts
+except ImportError:
+    orjson = None
 
 # Colors
 WHITE = (255, 255, 255)
@@ -51,11 +58,15 @@ BASE_TILE_SIZE = 50  # Base pixels per tile (before zoom)
 GRID_OFFSET_X = 50
 GRID_OFFSET_Y = 50
 
+# Posted by the layout I/O worker when a background save or load finishes
+LAYOUT_IO_DONE = pygame.event.custom_type()
+
 
 class LadderManagerGUI:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # VSync off: the frame rate is capped by clock.tick() and idle frames are skipped entirely
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), vsync=0)
         pygame.display.set_caption("Cable Ladder Manager")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
@@ -66,9 +77,11 @@ class LadderManagerGUI:
         self.min_zoom = 0.3
         self.max_zoom = 3.0
         self.zoom_step = 0.1
+        self.TILE_SIZE = int(BASE_TILE_SIZE * self.zoom_level)  # Pixels per tile, updated by set_zoom()
         
         # Create larger room (25x20 tiles to provide more space)
         self.room = Room(room_id="DC-MAIN", num_tiles_x=25, num_tiles_y=20, height=3.0)
+        self._recompute_pixel_grid()
         
         # Ladder management
         self.ladders = []
@@ -76,23 +89,83 @@ class LadderManagerGUI:
         self.ladder_start_point = None
         self.ladder_mode = False
         self.selected_section = None  # For selecting and deleting sections
+        self._section_index = {}  # (tile_x, tile_y) -> [(section, ladder), ...] for click hit-testing
+        self._section_to_ladder = {}  # Section -> the Ladder that owns it
         
         # UI state
         self.selected_tile = None
         self.hover_tile = None
+        self._last_mouse_pos = (0, 0)  # Latest pointer position seen in a mouse event
         self.obstacle_mode = False  # Toggle for placing obstacles
         self.placement_mode = "rack"  # "rack" or "obstacle"
         self.show_help = False  # Toggle help overlay with H key
+        self._status_log = collections.deque(maxlen=8)  # Recent status messages shown in the HUD
+        self._status_surface = None  # Rendered HUD and the messages it shows
+        self._status_surface_key = None
+        
+        # Render caches
+        self._grid_cache = None  # Pre-rendered tile grid, rebuilt when zoom or room size changes
+        self._grid_cache_key = None
+        self._dotted_tile = None  # Transparent tile-sized sprite with the dotted border
+        self._dotted_tile_size = None
+        self._statics_layer = None  # Racks and obstacles, rebuilt only when they change
+        self._statics_key = None
+        self._statics_dirty = True
+        self._overlay_surface = None  # Shade over every occupied tile, rebuilt when occupancy changes
+        self._overlay_key = None
+        self._overlay_dirty = True
+        self._hatch_cache = {}  # (width, height) in pixels -> obstacle stripe pattern
+        self._label_cache = {}  # (text, color) -> rendered small_font Surface
+        self._endpoint_sprite = pygame.Surface((9, 9), pygame.SRCALPHA)  # Ladder section end marker
+        pygame.draw.circle(self._endpoint_sprite, RED, (4, 4), 4)
+        self._ladder_geom = {}  # Section -> (start, end, line_width, color) in pixels
+        self._ladder_geom_key = None
+        self._help_panel_surface = None  # Rendered help overlay and the status it shows
+        self._help_panel_state = None
+        self._build_preview_surfaces()  # Translucent hover previews, rebuilt by set_zoom()
+        
+        # Dirty-rect tracking: mouse motion only changes the hover highlight and previews,
+        # so those frames push just the touched regions to the display instead of flipping.
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+        self._full_redraw = True
+        
+        # Layout files are written and parsed on a single worker thread (so jobs run in the order
+        # they were requested); results come back to the main loop as LAYOUT_IO_DONE events
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="layout-io")
+        self._layout_io = None  # Future of the most recent save/load job
         
         # Pre-populate with data racks in three rows
         self.populate_initial_racks()
         
         self.running = True
     
-    @property
-    def TILE_SIZE(self):
-        """Get current tile size based on zoom level"""
-        return int(BASE_TILE_SIZE * self.zoom_level)
+    def set_zoom(self, zoom_level):
+        """Set the zoom level (clamped to the allowed range) and update the tile size"""
+        self.zoom_level = max(self.min_zoom, min(self.max_zoom, zoom_level))
+        self.TILE_SIZE = int(BASE_TILE_SIZE * self.zoom_level)
+        self._recompute_pixel_grid()
+        self._build_preview_surfaces()
+
+    def _recompute_pixel_grid(self):
+        """Cache the screen x of every tile column and y of every tile row for the current zoom"""
+        ts = self.TILE_SIZE
+        self._px = [GRID_OFFSET_X + x * ts for x in range(self.room.num_tiles_x)]
+        self._py = [GRID_OFFSET_Y + y * ts for y in range(self.room.num_tiles_y)]
+
+    def _build_preview_surfaces(self):
+        """Pre-fill the translucent rack/obstacle hover previews for the current tile size"""
+        def filled(size, color):
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            surface.fill(color)
+            return surface
+
+        rack_size = self.TILE_SIZE * 2 - 4
+        obstacle_size = self.TILE_SIZE - 4
+        self._preview_rack_ok = filled(rack_size, (0, 255, 0, 80))
+        self._preview_rack_bad = filled(rack_size, (255, 0, 0, 80))
+        self._preview_obs_ok = filled(obstacle_size, (139, 69, 19, 120))  # Brown
+        self._preview_obs_bad = filled(obstacle_size, (255, 0, 0, 80))
 
     # ----------------------------
     # Initialization helpers
@@ -117,213 +190,225 @@ class LadderManagerGUI:
                     self.room.add_data_rack(rack)
                     rack_id += 1
 
+    def render_label(self, text, color):
+        """Render text with the small font, reusing a cached Surface when possible"""
+        key = (text, color)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = self._label_cache[key] = self.small_font.render(text, True, color)
+        return label
+
     def get_tile_from_mouse(self, mouse_pos):
         """Convert mouse position to tile coordinates"""
         x, y = mouse_pos
-        tile_x = (x - GRID_OFFSET_X) // self.TILE_SIZE
-        tile_y = (y - GRID_OFFSET_Y) // self.TILE_SIZE
+        ts = self.TILE_SIZE
+        tile_x = (x - GRID_OFFSET_X) // ts
+        tile_y = (y - GRID_OFFSET_Y) // ts
         
-        if 0 <= tile_x < self.room.num_tiles_x and 0 <= tile_y < self.room.num_tiles_y:
+        room = self.room
+        if 0 <= tile_x < room.num_tiles_x and 0 <= tile_y < room.num_tiles_y:
             return (int(tile_x), int(tile_y))
         return None
 
     def get_tile_center(self, tile_x, tile_y):
         """Get pixel coordinates of tile center"""
-        x = GRID_OFFSET_X + tile_x * self.TILE_SIZE + self.TILE_SIZE // 2
-        y = GRID_OFFSET_Y + tile_y * self.TILE_SIZE + self.TILE_SIZE // 2
-        return (x, y)
+        ts = self.TILE_SIZE
+        half = ts // 2
+        return (GRID_OFFSET_X + tile_x * ts + half, GRID_OFFSET_Y + tile_y * ts + half)
 
     def draw_grid(self):
         """Draw the tile grid with dotted lines"""
-        # Draw tiles
-        for x in range(self.room.num_tiles_x):
-            for y in range(self.room.num_tiles_y):
-                rect = pygame.Rect(
-                    GRID_OFFSET_X + x * self.TILE_SIZE,
-                    GRID_OFFSET_Y + y * self.TILE_SIZE,
-                    self.TILE_SIZE,
-                    self.TILE_SIZE
-                )
-                
-                # Fill tile background
-                if self.hover_tile == (x, y):
-                    pygame.draw.rect(self.screen, LIGHT_GRAY, rect)
-                else:
-                    pygame.draw.rect(self.screen, WHITE, rect)
-                
-                # Draw dotted border
-                self.draw_dotted_rect(rect, GRAY, 1)
+        cache_key = (self.TILE_SIZE, self.room.num_tiles_x, self.room.num_tiles_y)
+        if self._grid_cache_key != cache_key:
+            self._grid_cache = self._render_grid()
+            self._grid_cache_key = cache_key
+        self.screen.blit(self._grid_cache, (GRID_OFFSET_X, GRID_OFFSET_Y))
+
+        # Highlight the hovered tile on top of the cached grid
+        if self.hover_tile is not None:
+            x, y = self.hover_tile
+            rect = pygame.Rect(self._px[x], self._py[y], self.TILE_SIZE, self.TILE_SIZE)
+            self.screen.fill(LIGHT_GRAY, rect)
+            self.screen.blit(self._get_dotted_tile(), rect.topleft)
+            self._dirty_rects.append(pygame.Rect(rect.x, rect.y, rect.w + 1, rect.h + 1))
 
         # Overlay occupied tiles for clarity
         self.draw_occupied_overlay()
 
-    def draw_dotted_rect(self, rect, color, width):
-        """Draw a rectangle with dotted lines"""
+    def _render_grid(self):
+        """Render the empty tile grid with dotted borders into an off-screen surface."""
+        surface = pygame.Surface((
+            self.room.num_tiles_x * self.TILE_SIZE + 1,
+            self.room.num_tiles_y * self.TILE_SIZE + 1,
+        ))
+        # One fill covers every tile background
+        surface.fill(WHITE)
+
+        # Stamp the pre-baked dotted border onto every tile in one batched call
+        dotted_tile = self._get_dotted_tile()
+        surface.blits(
+            [
+                (dotted_tile, (x * self.TILE_SIZE, y * self.TILE_SIZE))
+                for x in range(self.room.num_tiles_x)
+                for y in range(self.room.num_tiles_y)
+            ],
+            doreturn=0,
+        )
+        return surface
+
+    def _get_dotted_tile(self):
+        """Return the dotted tile border sprite for the current tile size, baking it if needed."""
+        if self._dotted_tile_size != self.TILE_SIZE:
+            self._dotted_tile = self._make_dotted_tile(self.TILE_SIZE)
+            self._dotted_tile_size = self.TILE_SIZE
+        return self._dotted_tile
+
+    def _make_dotted_tile(self, size):
+        """Bake a transparent surface holding the dotted border of one tile."""
+        tile = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        self.draw_dotted_rect(pygame.Rect(0, 0, size, size), GRAY, 1, tile)
+        return tile
+
+    def draw_dotted_rect(self, rect, color, width, surface=None):
+        """Draw a rectangle with dotted lines (on the screen unless another surface is given)"""
+        if surface is None:
+            surface = self.screen
         dash_length = 4
         gap_length = 4
         
-        # Top line
-        self.draw_dotted_line(
-            (rect.left, rect.top),
-            (rect.right, rect.top),
-            color, width, dash_length, gap_length
-        )
-        # Bottom line
-        self.draw_dotted_line(
-            (rect.left, rect.bottom),
-            (rect.right, rect.bottom),
-            color, width, dash_length, gap_length
-        )
-        # Left line
-        self.draw_dotted_line(
-            (rect.left, rect.top),
-            (rect.left, rect.bottom),
-            color, width, dash_length, gap_length
-        )
-        # Right line
-        self.draw_dotted_line(
-            (rect.right, rect.top),
-            (rect.right, rect.bottom),
-            color, width, dash_length, gap_length
-        )
+        # Top and bottom lines
+        self._draw_dotted_hline(surface, rect.left, rect.right, rect.top, color, width, dash_length, gap_length)
+        self._draw_dotted_hline(surface, rect.left, rect.right, rect.bottom, color, width, dash_length, gap_length)
+        # Left and right lines
+        self._draw_dotted_vline(surface, rect.left, rect.top, rect.bottom, color, width, dash_length, gap_length)
+        self._draw_dotted_vline(surface, rect.right, rect.top, rect.bottom, color, width, dash_length, gap_length)
 
-    def draw_dotted_line(self, start, end, color, width, dash, gap):
-        """Draw a dotted line between two points"""
-        x1, y1 = start
-        x2, y2 = end
-        dx = x2 - x1
-        dy = y2 - y1
-        distance = math.sqrt(dx**2 + dy**2)
-        
-        if distance == 0:
-            return
-        
-        dx = dx / distance
-        dy = dy / distance
-        
-        current_distance = 0
-        while current_distance < distance:
-            start_x = x1 + dx * current_distance
-            start_y = y1 + dy * current_distance
-            end_distance = min(current_distance + dash, distance)
-            end_x = x1 + dx * end_distance
-            end_y = y1 + dy * end_distance
+    def _draw_dotted_hline(self, surface, x0, x1, y, color, width, dash, gap):
+        """Draw a horizontal dotted line from x0 to x1 using integer steps only"""
+        for x in range(x0, x1, dash + gap):
+            pygame.draw.line(surface, color, (x, y), (min(x + dash, x1), y), width)
+
+    def _draw_dotted_vline(self, surface, x, y0, y1, color, width, dash, gap):
+        """Draw a vertical dotted line from y0 to y1 using integer steps only"""
+        for y in range(y0, y1, dash + gap):
+            pygame.draw.line(surface, color, (x, y), (x, min(y + dash, y1)), width)
+
+    def draw_racks(self):
+        """Draw all data racks (and obstacles) from the cached statics layer"""
+        cache_key = (self.TILE_SIZE, self.room.num_tiles_x, self.room.num_tiles_y)
+        if self._statics_dirty or self._statics_key != cache_key:
+            self._rebuild_statics_layer()
+            self._statics_key = cache_key
+            self._statics_dirty = False
+        self.screen.blit(self._statics_layer, (GRID_OFFSET_X, GRID_OFFSET_Y))
+
+        # Draw a hover preview for a 2x2 rack (green if placeable, red if blocked)
+        self.draw_hover_rack_preview()
+
+    def draw_obstacles(self):
+        """Draw obstacle overlays (obstacles themselves are part of the statics layer)"""
+        # Draw hover preview for obstacle placement
+        self.draw_hover_obstacle_preview()
+
+    def _get_hatch(self, width, height):
+        """Return the transparent diagonal-stripe pattern for an obstacle rect of the given size"""
+        hatch = self._hatch_cache.get((width, height))
+        if hatch is None:
+            hatch = self._hatch_cache[(width, height)] = self._make_hatch(width, height)
+        return hatch
+
+    def _make_hatch(self, width, height):
+        """Draw obstacle stripes for a width x height rect, with a 1px margin for the 2px lines"""
+        hatch = pygame.Surface((width + 3, height + 3), pygame.SRCALPHA)
+        rect = pygame.Rect(1, 1, width, height)
+        stripe_spacing = 8
+        for i in range(0, rect.width + rect.height, stripe_spacing):
+            start_x = rect.left + i
+            start_y = rect.top
+            end_x = rect.left
+            end_y = rect.top + i
             
-            pygame.draw.line(
-                self.screen, color,
-                (int(start_x), int(start_y)),
-                (int(end_x), int(end_y)),
-                width
-            )
+            if start_x > rect.right:
+                start_x = rect.right
+                start_y = rect.top + (i - rect.width)
+            
+            if end_y > rect.bottom:
+                end_y = rect.bottom
+                end_x = rect.left + (i - rect.height)
             
-            current_distance += dash + gap
+            pygame.draw.line(hatch, LIGHT_BROWN, (start_x, start_y), (end_x, end_y), 2)
+        return hatch
+
+    def _rebuild_statics_layer(self):
+        """Render all racks and obstacles into a transparent surface covering the grid."""
+        layer = pygame.Surface(
+            (self.room.num_tiles_x * self.TILE_SIZE + 1, self.room.num_tiles_y * self.TILE_SIZE + 1),
+            pygame.SRCALPHA,
+        )
 
-    def draw_racks(self):
-        """Draw all data racks"""
         for rack in self.room.data_racks:
-            footprint = rack.get_tile_footprint()
-            
-            # Calculate rack rectangle
-            min_x = min(t[0] for t in footprint)
-            min_y = min(t[1] for t in footprint)
-            max_x = max(t[0] for t in footprint)
-            max_y = max(t[1] for t in footprint)
+            # Calculate rack rectangle from its cached tile bounds
+            min_x, min_y, max_x, max_y = rack.get_tile_bounds()
             
             rect = pygame.Rect(
-                GRID_OFFSET_X + min_x * self.TILE_SIZE + 2,
-                GRID_OFFSET_Y + min_y * self.TILE_SIZE + 2,
+                min_x * self.TILE_SIZE + 2,
+                min_y * self.TILE_SIZE + 2,
                 (max_x - min_x + 1) * self.TILE_SIZE - 4,
                 (max_y - min_y + 1) * self.TILE_SIZE - 4
             )
             
             # Draw rack
-            pygame.draw.rect(self.screen, DARK_BLUE, rect)
-            pygame.draw.rect(self.screen, BLUE, rect, 2)
+            pygame.draw.rect(layer, DARK_BLUE, rect)
+            pygame.draw.rect(layer, BLUE, rect, 2)
             
             # Draw rack label
-            label = self.small_font.render(rack.rack_id, True, WHITE)
+            label = self.render_label(rack.rack_id, WHITE)
             label_rect = label.get_rect(center=rect.center)
-            self.screen.blit(label, label_rect)
+            layer.blit(label, label_rect)
 
-        # Draw a hover preview for a 2x2 rack (green if placeable, red if blocked)
-        self.draw_hover_rack_preview()
-
-    def draw_obstacles(self):
-        """Draw all obstacles"""
         for obstacle in self.room.obstacles:
-            footprint = obstacle.get_tile_footprint()
-            
-            # Calculate obstacle rectangle
-            min_x = min(t[0] for t in footprint)
-            min_y = min(t[1] for t in footprint)
-            max_x = max(t[0] for t in footprint)
-            max_y = max(t[1] for t in footprint)
+            # Calculate obstacle rectangle from its cached tile bounds
+            min_x, min_y, max_x, max_y = obstacle.get_tile_bounds()
             
             rect = pygame.Rect(
-                GRID_OFFSET_X + min_x * self.TILE_SIZE + 2,
-                GRID_OFFSET_Y + min_y * self.TILE_SIZE + 2,
+                min_x * self.TILE_SIZE + 2,
+                min_y * self.TILE_SIZE + 2,
                 (max_x - min_x + 1) * self.TILE_SIZE - 4,
                 (max_y - min_y + 1) * self.TILE_SIZE - 4
             )
             
             # Draw obstacle with brown/hazard pattern
-            pygame.draw.rect(self.screen, DARK_BROWN, rect)
-            pygame.draw.rect(self.screen, BROWN, rect, 3)
+            pygame.draw.rect(layer, DARK_BROWN, rect)
+            pygame.draw.rect(layer, BROWN, rect, 3)
             
-            # Draw diagonal stripes for obstacle pattern
-            stripe_spacing = 8
-            for i in range(0, rect.width + rect.height, stripe_spacing):
-                start_x = rect.left + i
-                start_y = rect.top
-                end_x = rect.left
-                end_y = rect.top + i
-                
-                if start_x > rect.right:
-                    start_x = rect.right
-                    start_y = rect.top + (i - rect.width)
-                
-                if end_y > rect.bottom:
-                    end_y = rect.bottom
-                    end_x = rect.left + (i - rect.height)
-                
-                pygame.draw.line(self.screen, LIGHT_BROWN, (start_x, start_y), (end_x, end_y), 2)
+            # Draw diagonal stripes for obstacle pattern from the pre-rendered hatch
+            layer.blit(self._get_hatch(rect.width, rect.height), (rect.left - 1, rect.top - 1))
             
             # Draw obstacle label
-            label = self.small_font.render(obstacle.obstacle_id, True, WHITE)
+            label = self.render_label(obstacle.obstacle_id, WHITE)
             label_rect = label.get_rect(center=rect.center)
-            self.screen.blit(label, label_rect)
+            layer.blit(label, label_rect)
 
-        # Draw hover preview for obstacle placement
-        self.draw_hover_obstacle_preview()
+        self._statics_layer = layer
 
 
     def draw_ladders(self):
         """Draw all ladder segments with width visualization"""
+        # Cached section geometry is in pixels, so it is only valid for one tile size
+        if self._ladder_geom_key != self.TILE_SIZE:
+            self._ladder_geom.clear()
+            self._ladder_geom_key = self.TILE_SIZE
+        
+        sprite = self._endpoint_sprite
+        endpoints = []
+        labels = []
         for ladder in self.ladders:
             for section in ladder.sections:
-                start = self.get_tile_center(int(section.x_coord), int(section.y_coord))
-                
-                # Calculate end point based on orientation and length
-                if section.orientation == "horizontal":
-                    end = (start[0] + int(section.length * self.TILE_SIZE), start[1])
-                else:  # vertical
-                    end = (start[0], start[1] + int(section.length * self.TILE_SIZE))
-                
-                # Calculate line width based on ladder width (cm to pixels)
-                # Standard widths: 30cm, 60cm, 90cm, 120cm
-                # Map to reasonable pixel widths: 4, 8, 12, 16
+                geom = self._ladder_geom.get(section)
+                if geom is None:
+                    geom = self._ladder_geom[section] = self._section_geometry(section)
+                start, end, line_width, color = geom
                 ladder_width_cm = getattr(section, 'width', 30.0)
-                line_width = max(3, int(ladder_width_cm / 10))  # Scale: 30cm -> 3px, 60cm -> 6px, etc.
-                
-                # Color based on width (capacity indicator)
-                if ladder_width_cm <= 30:
-                    color = ORANGE  # Small capacity
-                elif ladder_width_cm <= 60:
-                    color = (255, 200, 0)  # Medium capacity (yellow-orange)
-                elif ladder_width_cm <= 90:
-                    color = (200, 255, 0)  # Good capacity (yellow-green)
-                else:
-                    color = GREEN  # High capacity
                 
                 # Highlight selected section
                 if self.selected_section == section:
@@ -353,23 +438,54 @@ class LadderManagerGUI:
                                    (start[0] + offset, start[1]), 
                                    (end[0] + offset, end[1]), 1)
                 
-                # Draw end points
-                pygame.draw.circle(self.screen, RED, start, 4)
-                pygame.draw.circle(self.screen, RED, end, 4)
+                # Queue end points and the label; they are blitted in one batch on top
+                endpoints.append((sprite, (start[0] - 4, start[1] - 4)))
+                endpoints.append((sprite, (end[0] - 4, end[1] - 4)))
                 
                 # Draw width label for selected or hovered section
                 if self.selected_section == section:
                     mid_x = (start[0] + end[0]) // 2
                     mid_y = (start[1] + end[1]) // 2
-                    label = self.small_font.render(f"{int(ladder_width_cm)}cm", True, BLACK)
+                    label = self.render_label(f"{int(ladder_width_cm)}cm", BLACK)
                     
                     # Background for label
                     label_bg = pygame.Surface((label.get_width() + 4, label.get_height() + 2), pygame.SRCALPHA)
                     label_bg.fill((255, 255, 255, 200))
-                    self.screen.blit(label_bg, (mid_x - label.get_width() // 2 - 2, mid_y - label.get_height() // 2 - 1))
-                    self.screen.blit(label, (mid_x - label.get_width() // 2, mid_y - label.get_height() // 2))
+                    labels.append((label_bg, (mid_x - label.get_width() // 2 - 2, mid_y - label.get_height() // 2 - 1)))
+                    labels.append((label, (mid_x - label.get_width() // 2, mid_y - label.get_height() // 2)))
+        
+        if endpoints or labels:
+            self.screen.blits(endpoints + labels, doreturn=0)
 
 
+    def _section_geometry(self, section):
+        """Compute the (start, end, line_width, color) used to draw a section at the current zoom"""
+        start = self.get_tile_center(int(section.x_coord), int(section.y_coord))
+        
+        # Calculate end point based on orientation and length
+        if section.orientation == "horizontal":
+            end = (start[0] + int(section.length * self.TILE_SIZE), start[1])
+        else:  # vertical
+            end = (start[0], start[1] + int(section.length * self.TILE_SIZE))
+        
+        # Calculate line width based on ladder width (cm to pixels)
+        # Standard widths: 30cm, 60cm, 90cm, 120cm
+        # Map to reasonable pixel widths: 4, 8, 12, 16
+        ladder_width_cm = getattr(section, 'width', 30.0)
+        line_width = max(3, int(ladder_width_cm / 10))  # Scale: 30cm -> 3px, 60cm -> 6px, etc.
+        
+        # Color based on width (capacity indicator)
+        if ladder_width_cm <= 30:
+            color = ORANGE  # Small capacity
+        elif ladder_width_cm <= 60:
+            color = (255, 200, 0)  # Medium capacity (yellow-orange)
+        elif ladder_width_cm <= 90:
+            color = (200, 255, 0)  # Good capacity (yellow-green)
+        else:
+            color = GREEN  # High capacity
+        
+        return start, end, line_width, color
+
     def draw_ladder_preview(self, mouse_pos):
         """Draw preview of ladder segment being placed"""
         if self.ladder_start_point and self.ladder_mode:
@@ -388,18 +504,59 @@ class LadderManagerGUI:
                 snapped_end = mouse_pos
 
             # Draw line to snapped end
-            pygame.draw.line(self.screen, YELLOW, start, snapped_end, 3)
-            pygame.draw.circle(self.screen, YELLOW, start, 6)
+            self._dirty_rects.append(pygame.draw.line(self.screen, YELLOW, start, snapped_end, 3))
+            self._dirty_rects.append(pygame.draw.circle(self.screen, YELLOW, start, 6))
+
+    def _log(self, message):
+        """Record a status message for the on-screen HUD (instead of printing to stdout)"""
+        self._status_log.append(message)
+
+    def draw_status_log(self):
+        """Draw the recent status messages in the bottom-left corner of the window"""
+        if not self._status_log:
+            return
+        key = tuple(self._status_log)
+        if self._status_surface_key != key:
+            self._status_surface = self._render_status_log()
+            self._status_surface_key = key
+        self.screen.blit(self._status_surface, (10, WINDOW_HEIGHT - self._status_surface.get_height() - 10))
+
+    def _render_status_log(self):
+        """Render the status messages, oldest first, onto a translucent panel"""
+        lines = [self.small_font.render(message, True, BLACK) for message in self._status_log]
+        line_height = self.small_font.get_linesize()
+        surface = pygame.Surface(
+            (max(line.get_width() for line in lines) + 12, line_height * len(lines) + 8),
+            pygame.SRCALPHA,
+        )
+        surface.fill((255, 255, 255, 200))
+        surface.blits([(line, (6, 4 + i * line_height)) for i, line in enumerate(lines)], doreturn=0)
+        return surface.convert_alpha()
 
     def draw_help_overlay(self):
         """Draw a semi-transparent help overlay when toggled with H key"""
         if not self.show_help:
             return
         
+        # The panel only changes with the status values it shows, so reuse the last rendering
+        state = (
+            self.ladder_mode,
+            self.placement_mode,
+            self.zoom_level,
+            len(self.room.data_racks),
+            len(self.room.obstacles),
+            len(self.ladders),
+        )
+        if self._help_panel_state != state:
+            self._help_panel_surface = self._render_help_panel()
+            self._help_panel_state = state
+        self.screen.blit(self._help_panel_surface, (0, 0))
+
+    def _render_help_panel(self):
+        """Render the full help overlay (dimmed background, panel, text and legend) off-screen"""
         # Semi-transparent background
         overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
         
         # Help panel in center
         panel_width = 400
@@ -408,15 +565,15 @@ class LadderManagerGUI:
         panel_y = (WINDOW_HEIGHT - panel_height) // 2
         
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, LIGHT_GRAY, panel_rect)
-        pygame.draw.rect(self.screen, DARK_GRAY, panel_rect, 3)
+        pygame.draw.rect(overlay, LIGHT_GRAY, panel_rect)
+        pygame.draw.rect(overlay, DARK_GRAY, panel_rect, 3)
         
         y_offset = panel_y + 20
         
         # Title
         title = self.font.render("CONTROLS (Press H to close)", True, BLACK)
         title_rect = title.get_rect(center=(panel_x + panel_width // 2, y_offset))
-        self.screen.blit(title, title_rect)
+        overlay.blit(title, title_rect)
         y_offset += 50
         
         # Instructions in two columns
@@ -465,26 +622,26 @@ class LadderManagerGUI:
         # Draw left column
         for instruction in left_instructions:
             if instruction.endswith(":"):
-                text = self.small_font.render(instruction, True, DARK_BLUE)
+                text = self.render_label(instruction, DARK_BLUE)
             else:
-                text = self.small_font.render(instruction, True, BLACK)
-            self.screen.blit(text, (left_col_x, y_offset))
+                text = self.render_label(instruction, BLACK)
+            overlay.blit(text, (left_col_x, y_offset))
             y_offset += 22
         
         # Draw right column
         y_offset = panel_y + 70
         for instruction in right_instructions:
             if instruction.endswith(":"):
-                text = self.small_font.render(instruction, True, DARK_BLUE)
+                text = self.render_label(instruction, DARK_BLUE)
             else:
-                text = self.small_font.render(instruction, True, BLACK)
-            self.screen.blit(text, (right_col_x, y_offset))
+                text = self.render_label(instruction, BLACK)
+            overlay.blit(text, (right_col_x, y_offset))
             y_offset += 22
         
         # Draw color legend for ladders at bottom
         y_offset = panel_y + panel_height - 80
-        legend_title = self.small_font.render("LADDER WIDTH COLOR CODE:", True, DARK_BLUE)
-        self.screen.blit(legend_title, (left_col_x, y_offset))
+        legend_title = self.render_label("LADDER WIDTH COLOR CODE:", DARK_BLUE)
+        overlay.blit(legend_title, (left_col_x, y_offset))
         y_offset += 25
         
         colors_and_labels = [
@@ -495,12 +652,14 @@ class LadderManagerGUI:
         ]
         
         for color, label in colors_and_labels:
-            pygame.draw.rect(self.screen, color, (left_col_x, y_offset, 20, 12))
-            pygame.draw.rect(self.screen, BLACK, (left_col_x, y_offset, 20, 12), 1)
-            text = self.small_font.render(label, True, BLACK)
-            self.screen.blit(text, (left_col_x + 25, y_offset - 2))
+            pygame.draw.rect(overlay, color, (left_col_x, y_offset, 20, 12))
+            pygame.draw.rect(overlay, BLACK, (left_col_x, y_offset, 20, 12), 1)
+            text = self.render_label(label, BLACK)
+            overlay.blit(text, (left_col_x + 25, y_offset - 2))
             y_offset += 16
 
+        return overlay
+
     def add_ladder_segment(self, start_tile, end_tile):
         """Add a new ladder segment between two tiles"""
         x1, y1 = start_tile
@@ -528,6 +687,32 @@ class LadderManagerGUI:
             orientation=orientation
         )
         self.current_ladder.add_section(section)
+        self._index_section(section, self.current_ladder)
+
+    def _section_tiles(self, section):
+        """Tiles whose centres lie on the section's centre line"""
+        x, y = int(section.x_coord), int(section.y_coord)
+        steps = range(int(section.length) + 1)
+        if section.orientation == "horizontal":
+            return [(x + i, y) for i in steps]
+        return [(x, y + i) for i in steps]
+
+    def _index_section(self, section, ladder):
+        """Register a section in the tile -> section spatial index and the owner map"""
+        self._section_to_ladder[section] = ladder
+        for tile in self._section_tiles(section):
+            self._section_index.setdefault(tile, []).append((section, ladder))
+
+    def _unindex_section(self, section):
+        """Remove a section from the tile -> section spatial index and the owner map"""
+        self._section_to_ladder.pop(section, None)
+        for tile in self._section_tiles(section):
+            entries = self._section_index.get(tile)
+            if entries is None:
+                continue
+            entries[:] = [entry for entry in entries if entry[0] is not section]
+            if not entries:
+                del self._section_index[tile]
 
     # ----------------------------
     # Rack helpers and previews
@@ -540,12 +725,8 @@ class LadderManagerGUI:
             return False
         if tile_x + width_tiles > self.room.num_tiles_x or tile_y + depth_tiles > self.room.num_tiles_y:
             return False
-        # Collision check
-        for dx in range(width_tiles):
-            for dy in range(depth_tiles):
-                if self.room.tile_grid[tile_x + dx][tile_y + dy]:
-                    return False
-        return True
+        # Collision check as a single reduction over the footprint slice
+        return not self.room.tile_grid[tile_x:tile_x + width_tiles, tile_y:tile_y + depth_tiles].any()
 
     def draw_hover_rack_preview(self):
         """Draw a 2x2 rack placement preview at hover tile (green=ok, red=blocked)."""
@@ -557,18 +738,10 @@ class LadderManagerGUI:
 
         tx, ty = self.hover_tile
         fits = self.can_place_rack(tx, ty, 2, 2)
-        color = (0, 255, 0, 80) if fits else (255, 0, 0, 80)
+        s = self._preview_rack_ok if fits else self._preview_rack_bad
 
         # Draw translucent rect over the 2x2 area
-        s = pygame.Surface((self.TILE_SIZE * 2 - 4, self.TILE_SIZE * 2 - 4), pygame.SRCALPHA)
-        s.fill(color)
-        self.screen.blit(
-            s,
-            (
-                GRID_OFFSET_X + tx * self.TILE_SIZE + 2,
-                GRID_OFFSET_Y + ty * self.TILE_SIZE + 2,
-            ),
-        )
+        self._dirty_rects.append(self.screen.blit(s, (self._px[tx] + 2, self._py[ty] + 2)))
     
     def draw_hover_obstacle_preview(self):
         """Draw a 1x1 obstacle placement preview at hover tile (brown=ok, red=blocked)."""
@@ -580,18 +753,10 @@ class LadderManagerGUI:
 
         tx, ty = self.hover_tile
         fits = self.can_place_rack(tx, ty, 1, 1)  # Reuse rack placement check for single tile
-        color = (139, 69, 19, 120) if fits else (255, 0, 0, 80)  # Brown or red
+        s = self._preview_obs_ok if fits else self._preview_obs_bad  # Brown or red
 
         # Draw translucent rect over the 1x1 area
-        s = pygame.Surface((self.TILE_SIZE - 4, self.TILE_SIZE - 4), pygame.SRCALPHA)
-        s.fill(color)
-        self.screen.blit(
-            s,
-            (
-                GRID_OFFSET_X + tx * self.TILE_SIZE + 2,
-                GRID_OFFSET_Y + ty * self.TILE_SIZE + 2,
-            ),
-        )
+        self._dirty_rects.append(self.screen.blit(s, (self._px[tx] + 2, self._py[ty] + 2)))
 
     def add_rack_at_tile(self, tile_x, tile_y):
         """Add a new 2x2 rack at the specified tile"""
@@ -604,9 +769,11 @@ class LadderManagerGUI:
             depth_tiles=2
         )
         if self.room.add_data_rack(rack):
-            print(f"Added {rack.rack_id} at ({tile_x}, {tile_y})")
+            self._statics_dirty = True
+            self._overlay_dirty = True
+            self._log(f"Added {rack.rack_id} at ({tile_x}, {tile_y})")
         else:
-            print(f"Failed to place rack at ({tile_x}, {tile_y}) - tiles occupied or out of bounds")
+            self._log(f"Failed to place rack at ({tile_x}, {tile_y}) - tiles occupied or out of bounds")
     
     def add_obstacle_at_tile(self, tile_x, tile_y):
         """Add a new 1x1 obstacle at the specified tile"""
@@ -619,33 +786,43 @@ class LadderManagerGUI:
             height=2.0
         )
         if self.room.add_obstacle(obstacle):
-            print(f"Added {obstacle.obstacle_id} at ({tile_x}, {tile_y})")
+            self._statics_dirty = True
+            self._overlay_dirty = True
+            self._log(f"Added {obstacle.obstacle_id} at ({tile_x}, {tile_y})")
         else:
-            print(f"Failed to place obstacle at ({tile_x}, {tile_y}) - tiles occupied or out of bounds")
+            self._log(f"Failed to place obstacle at ({tile_x}, {tile_y}) - tiles occupied or out of bounds")
     
     def get_section_at_position(self, pixel_pos):
-        """Find a ladder section at the given pixel position (for selection)."""
+        """Find the ladder section nearest to the given pixel position (for selection)."""
         x, y = pixel_pos
         tolerance = 10  # pixels
+        ts = self.TILE_SIZE
         
-        for ladder in self.ladders:
-            for section in ladder.sections:
-                start = self.get_tile_center(int(section.x_coord), int(section.y_coord))
-                
-                if section.orientation == "horizontal":
-                    end = (start[0] + int(section.length * self.TILE_SIZE), start[1])
-                    # Check if click is near the horizontal line
-                    if (min(start[0], end[0]) - tolerance <= x <= max(start[0], end[0]) + tolerance and
-                        abs(y - start[1]) <= tolerance):
-                        return section, ladder
-                else:  # vertical
-                    end = (start[0], start[1] + int(section.length * self.TILE_SIZE))
-                    # Check if click is near the vertical line
-                    if (abs(x - start[0]) <= tolerance and
-                        min(start[1], end[1]) - tolerance <= y <= max(start[1], end[1]) + tolerance):
-                        return section, ladder
-        
-        return None, None
+        # Only sections registered on tiles around the click can be within tolerance
+        reach = tolerance // ts + 2
+        cx, cy = (x - GRID_OFFSET_X) // ts, (y - GRID_OFFSET_Y) // ts
+        index = self._section_index
+        best, best_ladder, best_dist = None, None, tolerance + 1
+        for tx in range(cx - reach, cx + reach + 1):
+            for ty in range(cy - reach, cy + reach + 1):
+                for section, ladder in index.get((tx, ty), ()):
+                    dist = self._section_pixel_distance(section, x, y)
+                    if dist < best_dist:
+                        best, best_ladder, best_dist = section, ladder, dist
+        
+        return best, best_ladder
+
+    def _section_pixel_distance(self, section, x, y):
+        """Distance in pixels from (x, y) to the section as drawn: the larger of the perpendicular
+        offset and the overshoot past either end"""
+        sx, sy = self.get_tile_center(int(section.x_coord), int(section.y_coord))
+        span = int(section.length * self.TILE_SIZE)
+        if section.orientation == "horizontal":
+            along, across, start = x, y - sy, sx
+        else:
+            along, across, start = y, x - sx, sy
+        overshoot = max(start - along, along - (start + span), 0)
+        return max(abs(across), overshoot)
 
     # ----------------------------
     # Save / Load
@@ -653,9 +830,20 @@ class LadderManagerGUI:
 
     def save_layout(self, path: str = "layout.json"):
         """Save room, racks, obstacles, and ladders to a JSON file."""
-        import json
+        self._write_layout_file(self._layout_data(), path)
+        print(f"Saved layout to {os.path.abspath(path)}")
+
+    def save_layout_async(self, path: str = "layout.json"):
+        """Snapshot the layout now and write it to a JSON file on the I/O worker thread."""
+        self._layout_io = self._io_executor.submit(self._save_job, self._layout_data(), path)
 
-        data = {
+    def load_layout_async(self, path: str = "layout.json"):
+        """Read and parse a layout file on the I/O worker thread; it is applied when LAYOUT_IO_DONE arrives."""
+        self._layout_io = self._io_executor.submit(self._load_job, path)
+
+    def _layout_data(self) -> dict:
+        """Build the JSON-serializable description of the current layout."""
+        return {
             "room": {
                 "room_id": self.room.room_id,
                 "num_tiles_x": self.room.num_tiles_x,
@@ -706,32 +894,119 @@ class LadderManagerGUI:
             ],
         }
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        print(f"Saved layout to {os.path.abspath(path)}")
+    @staticmethod
+    def _write_layout_file(data: dict, path: str):
+        """Serialize layout data to a JSON file."""
+        # Compact JSON, serialized into one buffer and written with a single call
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(payload)
+
+    @staticmethod
+    def _read_layout_file(path: str) -> dict:
+        """Read and parse a JSON layout file."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    def _save_job(self, data: dict, path: str):
+        """Worker thread: write a layout snapshot and report back to the main loop."""
+        try:
+            self._write_layout_file(data, path)
+            pygame.event.post(pygame.event.Event(LAYOUT_IO_DONE, action="save", path=path, data=None, error=None))
+        except (OSError, TypeError, ValueError) as exc:
+            pygame.event.post(pygame.event.Event(LAYOUT_IO_DONE, action="save", path=path, data=None, error=exc))
+
+    def _load_job(self, path: str):
+        """Worker thread: read and parse a layout file and hand it to the main loop."""
+        try:
+            data = self._read_layout_file(path)
+            pygame.event.post(pygame.event.Event(LAYOUT_IO_DONE, action="load", path=path, data=data, error=None))
+        except (OSError, ValueError) as exc:
+            pygame.event.post(pygame.event.Event(LAYOUT_IO_DONE, action="load", path=path, data=None, error=exc))
+
+    def _on_layout_io_done(self, event):
+        """Main thread: finish a background save or load."""
+        if event.error is not None:
+            if event.action == "load" and isinstance(event.error, FileNotFoundError):
+                self._log(f"Layout file not found: {event.path}")
+            else:
+                self._log(f"Could not {event.action} layout {event.path}: {event.error}")
+        elif event.action == "load":
+            try:
+                self.apply_layout(event.data)
+            except (KeyError, TypeError, ValueError) as exc:
+                self._log(f"Could not load layout {event.path}: invalid data ({exc!r})")
+                return
+            self._log(f"Loaded layout from {os.path.abspath(event.path)}")
+        else:
+            self._log(f"Saved layout to {os.path.abspath(event.path)}")
 
     def load_layout(self, path: str = "layout.json"):
         """Load room, racks, and ladders from a JSON file."""
-        import json
         if not os.path.exists(path):
             print(f"Layout file not found: {path}")
             return
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            self.apply_layout(self._read_layout_file(path))
+        except (KeyError, TypeError, ValueError) as exc:
+            print(f"Could not load layout {path}: invalid data ({exc!r})")
+            return
+        print(f"Loaded layout from {os.path.abspath(path)}")
+
+    def apply_layout(self, data: dict):
+        """Replace the room, racks, obstacles, and ladders with parsed layout data.
+
+        Raises KeyError, TypeError or ValueError for malformed data, leaving the current layout untouched.
+        """
+        room, ladders, warnings = self._build_layout(data)
+
+        # Everything was built, swap it in
+        self.room = room
+        self._recompute_pixel_grid()
+        if self.hover_tile is not None:
+            hx, hy = self.hover_tile
+            if hx >= self.room.num_tiles_x or hy >= self.room.num_tiles_y:
+                self.hover_tile = None  # The hovered tile is outside the new room
+
+        self.ladders = ladders
+        self.current_ladder = None
+        self._section_index.clear()
+        self._section_to_ladder.clear()
+        for ladder in ladders:
+            for section in ladder.sections:
+                self._index_section(section, ladder)
+        self._statics_dirty = True
+        self._overlay_dirty = True
+        self._label_cache.clear()
+        self._ladder_geom.clear()
+
+        for message in warnings:
+            self._log(message)
+
+    @staticmethod
+    def _build_layout(data: dict):
+        """Build a new room and ladders from parsed layout data without touching the current layout.
+
+        Returns (room, ladders, warnings), where warnings lists racks and obstacles that could not be placed.
+        """
+        warnings = []
 
         # Recreate room
         rd = data["room"]
-        self.room = Room(
+        room = Room(
             room_id=rd["room_id"],
             num_tiles_x=int(rd["num_tiles_x"]),
             num_tiles_y=int(rd["num_tiles_y"]),
             height=float(rd["height"]),
         )
-        self.room.tile_size_xy = float(rd.get("tile_size_xy", 0.6))
+        room.tile_size_xy = float(rd.get("tile_size_xy", 0.6))
 
         # Racks
-        self.room.data_racks.clear()
         for r in data.get("racks", []):
             rack = DataRack(
                 rack_id=r["rack_id"],
@@ -742,12 +1017,11 @@ class LadderManagerGUI:
                 depth_tiles=int(r.get("depth_tiles", 1)),
             )
             # Use add_data_rack to set occupancy
-            placed = self.room.add_data_rack(rack)
+            placed = room.add_data_rack(rack)
             if not placed:
-                print(f"Warning: could not place rack {rack.rack_id} from file (occupied/out of bounds)")
+                warnings.append(f"Warning: could not place rack {rack.rack_id} from file (occupied/out of bounds)")
 
         # Obstacles
-        self.room.obstacles.clear()
         for o in data.get("obstacles", []):
             obstacle = Obstacle(
                 obstacle_id=o["obstacle_id"],
@@ -758,66 +1032,119 @@ class LadderManagerGUI:
                 height=float(o.get("height", 1.0)),
             )
             # Use add_obstacle to set occupancy
-            placed = self.room.add_obstacle(obstacle)
+            placed = room.add_obstacle(obstacle)
             if not placed:
-                print(f"Warning: could not place obstacle {obstacle.obstacle_id} from file (occupied/out of bounds)")
+                warnings.append(f"Warning: could not place obstacle {obstacle.obstacle_id} from file (occupied/out of bounds)")
 
         # Ladders
-        self.ladders = []
-        self.current_ladder = None
+        ladders = []
         for ld in data.get("ladders", []):
-            ladder = Ladder(ld.get("ladder_id", f"LAD-{len(self.ladders)+1:03d}"))
-            for s in ld.get("sections", []):
-                ladder.add_section(
-                    Section(
-                        section_id=s.get("section_id", f"SEC-{len(ladder.sections)+1:03d}"),
-                        x_coord=float(s["x_coord"]),
-                        y_coord=float(s["y_coord"]),
-                        length=float(s["length"]),
-                        orientation=s["orientation"],
-                        bend_degree=float(s.get("curved_degree", 0.0)),
-                        width=float(s.get("width", 30.0)),
-                        material=s.get("material", "aluminum"),
-                    )
+            ladder = Ladder(ld.get("ladder_id", f"LAD-{len(ladders)+1:03d}"))
+            ladder.add_sections(
+                Section(
+                    section_id=s.get("section_id", f"SEC-{i + 1:03d}"),
+                    x_coord=float(s["x_coord"]),
+                    y_coord=float(s["y_coord"]),
+                    length=float(s["length"]),
+                    orientation=s["orientation"],
+                    bend_degree=float(s.get("curved_degree", 0.0)),
+                    width=float(s.get("width", 30.0)),
+                    material=sys.intern(s.get("material", "aluminum")),  # Share one string per material
                 )
-            self.ladders.append(ladder)
-        print(f"Loaded layout from {os.path.abspath(path)}")
+                for i, s in enumerate(ld.get("sections", []))
+            )
+            ladders.append(ladder)
+        return room, ladders, warnings
 
     # ----------------------------
     # Overlays
     # ----------------------------
     def draw_occupied_overlay(self):
         """Light overlay on occupied tiles for quick visual feedback."""
-        overlay = pygame.Surface((self.TILE_SIZE - 6, self.TILE_SIZE - 6), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 25))
+        cache_key = (self.TILE_SIZE, self.room.num_tiles_x, self.room.num_tiles_y)
+        if self._overlay_dirty or self._overlay_key != cache_key:
+            self._overlay_surface = self._render_occupied_overlay()
+            self._overlay_key = cache_key
+            self._overlay_dirty = False
+        self.screen.blit(self._overlay_surface, (GRID_OFFSET_X, GRID_OFFSET_Y))
+
+    def _render_occupied_overlay(self):
+        """Render the occupied-tile shading for the whole room into one transparent surface"""
+        ts = self.TILE_SIZE
+        surface = pygame.Surface((self.room.num_tiles_x * ts, self.room.num_tiles_y * ts), pygame.SRCALPHA)
+        shade = (0, 0, 0, 25)
         for (x, y) in self.room.get_occupied_tiles():
-            self.screen.blit(
-                overlay,
-                (
-                    GRID_OFFSET_X + x * self.TILE_SIZE + 3,
-                    GRID_OFFSET_Y + y * self.TILE_SIZE + 3,
-                ),
-            )
+            surface.fill(shade, (x * ts + 3, y * ts + 3, ts - 6, ts - 6))
+        return surface.convert_alpha()
+
+    @staticmethod
+    def _coalesce_mouse_events(events):
+        """Collapse runs of consecutive mouse motion and mouse wheel events.
+
+        Only the last position of a run of motion events matters for the hover tile, and a
+        run of wheel ticks (trackpads emit many small ones) becomes a single event with the
+        summed scroll amount, so a gesture rescales once. Events are never reordered past
+        other events, so clicks and key presses still see the hover tile and zoom level
+        that were current when they happened.
+        """
+        motion, wheel = pygame.MOUSEMOTION, pygame.MOUSEWHEEL
+        coalesced = []
+        for event in events:
+            if coalesced and event.type == coalesced[-1].type:
+                if event.type == motion:
+                    coalesced[-1] = event
+                    continue
+                if event.type == wheel:
+                    previous = coalesced[-1]
+                    coalesced[-1] = pygame.event.Event(
+                        wheel, {**event.dict, "x": previous.x + event.x, "y": previous.y + event.y}
+                    )
+                    continue
+            coalesced.append(event)
+        return coalesced
+
+    def handle_events(self, events=None):
+        """Handle pygame events (drains the event queue unless a list of events is given).
+
+        Returns True if the events changed anything that needs to be redrawn.
+        """
+        if events is None:
+            # Pump SDL once, then drain the whole queue in a single batch
+            pygame.event.pump()
+            events = pygame.event.get(pump=False)
+        changed = False
+        for event in self._coalesce_mouse_events(events):
+            if event.type != pygame.MOUSEMOTION:
+                # Anything but mouse motion may change the whole scene
+                self._full_redraw = True
+                changed = True
 
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type == LAYOUT_IO_DONE:
+                self._on_layout_io_done(event)
+            
             elif event.type == pygame.MOUSEMOTION:
+                self._last_mouse_pos = event.pos
+                prev_hover_tile = self.hover_tile
                 self.hover_tile = self.get_tile_from_mouse(event.pos)
+                # Motion within the same tile changes nothing on screen, except the ladder
+                # preview which follows the raw mouse position outside the grid
+                if self.hover_tile != prev_hover_tile:
+                    changed = True
+                elif self.hover_tile is None and self.ladder_mode and self.ladder_start_point:
+                    changed = True
             
             elif event.type == pygame.MOUSEWHEEL:
                 # Zoom in/out with mouse wheel
-                if event.y > 0:  # Scroll up = zoom in
-                    self.zoom_level = min(self.max_zoom, self.zoom_level + self.zoom_step)
-                    print(f"Zoom: {self.zoom_level:.1f}x")
-                elif event.y < 0:  # Scroll down = zoom out
-                    self.zoom_level = max(self.min_zoom, self.zoom_level - self.zoom_step)
-                    print(f"Zoom: {self.zoom_level:.1f}x")
+                # Scroll up = zoom in, scroll down = zoom out; one step per wheel tick
+                if event.y:
+                    self.set_zoom(self.zoom_level + event.y * self.zoom_step)
+                    self._log(f"Zoom: {self.zoom_level:.1f}x")
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
+                self._last_mouse_pos = event.pos
                 if event.button == 1:  # Left click
                     tile = self.get_tile_from_mouse(event.pos)
                     if self.ladder_mode and tile:
@@ -832,7 +1159,7 @@ class LadderManagerGUI:
                         section, ladder = self.get_section_at_position(event.pos)
                         if section:
                             self.selected_section = section
-                            print(f"Selected section {section.section_id} from {ladder.ladder_id} ({int(section.width)}cm wide)")
+                            self._log(f"Selected section {section.section_id} from {ladder.ladder_id} ({int(section.width)}cm wide)")
                         else:
                             self.selected_section = None
             
@@ -853,41 +1180,42 @@ class LadderManagerGUI:
                 elif event.key == pygame.K_t:
                     # Toggle between rack and obstacle placement mode
                     self.placement_mode = "obstacle" if self.placement_mode == "rack" else "rack"
-                    print(f"Placement mode: {self.placement_mode.upper()}")
+                    self._log(f"Placement mode: {self.placement_mode.upper()}")
                 
                 elif event.key == pygame.K_l:
                     # Toggle ladder mode
                     self.ladder_mode = not self.ladder_mode
                     self.ladder_start_point = None
                     self.selected_section = None
-                    print(f"Ladder mode: {'ON' if self.ladder_mode else 'OFF'}")
+                    self._log(f"Ladder mode: {'ON' if self.ladder_mode else 'OFF'}")
                 
                 elif event.key == pygame.K_c:
                     # Clear selection and ladder start point
                     self.ladder_start_point = None
                     self.selected_section = None
-                    print("Cleared selection")
+                    self._log("Cleared selection")
                 
                 elif event.key == pygame.K_DELETE:
                     # Delete selected section
                     if self.selected_section:
-                        # Find which ladder contains this section
-                        for ladder in self.ladders:
-                            if self.selected_section in ladder.sections:
-                                ladder.sections.remove(self.selected_section)
-                                print(f"Deleted section {self.selected_section.section_id}")
-                                # If ladder is now empty, remove it
-                                if not ladder.sections:
-                                    self.ladders.remove(ladder)
-                                    print(f"Removed empty ladder {ladder.ladder_id}")
-                                self.selected_section = None
-                                break
+                        section = self.selected_section
+                        ladder = self._section_to_ladder.get(section)
+                        if ladder is not None:
+                            ladder.pop_section(ladder.sections.index(section))
+                            self._ladder_geom.pop(section, None)
+                            self._unindex_section(section)
+                            self._log(f"Deleted section {section.section_id}")
+                            # If ladder is now empty, remove it
+                            if not ladder.sections:
+                                self.ladders.remove(ladder)
+                                self._log(f"Removed empty ladder {ladder.ladder_id}")
+                            self.selected_section = None
 
                 elif event.key == pygame.K_n:
                     # Finalize current ladder and start a new one on next section
                     self.current_ladder = None
                     self.ladder_start_point = None
-                    print("Started a new ladder (next segment creates it)")
+                    self._log("Started a new ladder (next segment creates it)")
 
                 elif event.key == pygame.K_u:
                     # Undo last section
@@ -899,38 +1227,65 @@ class LadderManagerGUI:
                         if last.sections:
                             target = last
                     if target and target.sections:
-                        removed = target.sections.pop()
-                        print(f"Undid section {removed.section_id}")
+                        removed = target.pop_section()
+                        self._ladder_geom.pop(removed, None)
+                        self._unindex_section(removed)
+                        self._log(f"Undid section {removed.section_id}")
                     else:
-                        print("Nothing to undo")
+                        self._log("Nothing to undo")
 
                 elif event.key == pygame.K_x:
                     # Delete last ladder
                     if self.ladders:
                         last = self.ladders.pop()
+                        for section in last.sections:
+                            self._ladder_geom.pop(section, None)
+                            self._unindex_section(section)
                         if self.current_ladder is last:
                             self.current_ladder = None
-                        print(f"Deleted ladder {last.ladder_id}")
+                        self._log(f"Deleted ladder {last.ladder_id}")
                     else:
-                        print("No ladders to delete")
+                        self._log("No ladders to delete")
 
                 elif event.key == pygame.K_s:
-                    # Save layout
-                    self.save_layout("layout.json")
+                    # Save layout (written in the background)
+                    self.save_layout_async("layout.json")
 
                 elif event.key == pygame.K_o:
-                    # Load layout
-                    self.load_layout("layout.json")
+                    # Load layout (parsed in the background, applied when done)
+                    self.load_layout_async("layout.json")
                 
                 elif event.key == pygame.K_h:
                     # Toggle help overlay
                     self.show_help = not self.show_help
-                    print(f"Help overlay: {'ON' if self.show_help else 'OFF'}")
+                    self._log(f"Help overlay: {'ON' if self.show_help else 'OFF'}")
+
+        return changed
+
+    def present(self):
+        """Push the frame to the display, updating only dirty regions when possible."""
+        rects = self._dirty_rects + self._prev_dirty_rects
+        dirty_area = sum(r.w * r.h for r in rects)
+        if self._full_redraw or dirty_area > WINDOW_WIDTH * WINDOW_HEIGHT // 2:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+        # Regions drawn this frame must be refreshed next frame too, to erase them
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        self._full_redraw = False
 
     def run(self):
         """Main game loop"""
+        events = None
         while self.running:
-            self.handle_events()
+            if not self.handle_events(events) and not self._full_redraw:
+                # Nothing visible changed since the last frame: sleep until the next event
+                # instead of re-rendering an unchanged scene
+                events = [pygame.event.wait()] + pygame.event.get()
+                continue
+            events = None
             
             # Draw everything
             self.screen.fill(WHITE)
@@ -941,15 +1296,18 @@ class LadderManagerGUI:
             
             # Draw ladder preview if in ladder mode
             if self.ladder_mode:
-                mouse_pos = pygame.mouse.get_pos()
-                self.draw_ladder_preview(mouse_pos)
+                self.draw_ladder_preview(self._last_mouse_pos)
             
-            # Draw help overlay (on top of everything if toggled)
+            # Status messages, then the help overlay (on top of everything if toggled)
+            self.draw_status_log()
             self.draw_help_overlay()
             
-            pygame.display.flip()
+            self.present()
             self.clock.tick(60)  # 60 FPS
         
+        # Let a pending save finish before exiting
+        if self._layout_io is not None:
+            self._layout_io.result()
         pygame.quit()
 
 
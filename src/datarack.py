@@ -1,7 +1,29 @@
+import numpy as np
+
+from footprint import tile_bounds, tile_footprint, tile_footprint_array
+
+
 class DataRack:
     '''
     Represents a data rack within a room.
     '''
+    __slots__ = (
+        "rack_id",
+        "position_x",
+        "position_y",
+        "rack_units",
+        "width_tiles",
+        "depth_tiles",
+        "rack_height_meters",
+        "rack_height_inches",
+        "rack_weight_kg_estimated",
+    )
+
+    # Per rack unit conversion factors
+    M_PER_U = 0.04445   # 1U = 44.45mm
+    IN_PER_U = 1.75     # 1U = 1.75 inches
+    KG_PER_U = 4.5      # Estimated weight per 1U
+
     def __init__(self, rack_id: str, position_x: int, position_y: int, rack_units: int, 
                  width_tiles: int = 1, depth_tiles: int = 1) -> None:
         self.rack_id = rack_id
@@ -11,9 +33,9 @@ class DataRack:
         self.width_tiles = width_tiles  # Number of tiles occupied in x direction
         self.depth_tiles = depth_tiles  # Number of tiles occupied in y direction
 
-        self.rack_height_meters = rack_units * 0.04445  # Convert rack units to meters (1U = 44.45mm)
-        self.rack_height_inches = rack_units * 1.75  # Convert rack units to inches (1U = 1.75 inches)
-        self.rack_weight_kg_estimated = rack_units * 4.5  # Convert rack units to weight (1U = 4.5kg)
+        self.rack_height_meters = rack_units * DataRack.M_PER_U  # Convert rack units to meters
+        self.rack_height_inches = rack_units * DataRack.IN_PER_U  # Convert rack units to inches
+        self.rack_weight_kg_estimated = rack_units * DataRack.KG_PER_U  # Convert rack units to weight
 
     def get_rack_id(self) -> str:
         """Return the rack ID."""
@@ -39,9 +61,9 @@ class DataRack:
     def set_rack_units(self, new_units: int) -> None:
         """Update the number of rack units."""
         self.rack_units = new_units
-        self.rack_height_meters = new_units * 0.04445  # Update height in meters
-        self.rack_height_inches = new_units * 1.75  # Update height in inches
-        self.rack_weight_kg_estimated = new_units * 4.5  # Update weight in kg
+        self.rack_height_meters = new_units * DataRack.M_PER_U  # Update height in meters
+        self.rack_height_inches = new_units * DataRack.IN_PER_U  # Update height in inches
+        self.rack_weight_kg_estimated = new_units * DataRack.KG_PER_U  # Update weight in kg
 
 
     def set_rack_position(self, new_x: int, new_y: int) -> None:
@@ -52,13 +74,17 @@ class DataRack:
 
 
     
+    def get_tile_footprint_array(self) -> np.ndarray:
+        """Return the occupied tiles as an (N, 2) int32 array of (x, y) rows."""
+        return tile_footprint_array(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
+
     def get_tile_footprint(self) -> list[tuple[int, int]]:
         """Get a list of all tile coordinates occupied by this rack."""
-        tiles = []
-        for dx in range(self.width_tiles):
-            for dy in range(self.depth_tiles):
-                tiles.append((self.position_x + dx, self.position_y + dy))
-        return tiles
+        return tile_footprint(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
+
+    def get_tile_bounds(self) -> tuple[int, int, int, int]:
+        """Return the (min_x, min_y, max_x, max_y) tiles covered by this rack."""
+        return tile_bounds(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
 
     def get_rack_info(self) -> dict:
         """Get a dictionary of rack information."""
@@ -72,7 +98,7 @@ class DataRack:
             "rack_height_meters": self.rack_height_meters,
             "rack_height_inches": self.rack_height_inches,
             "rack_weight_kg_estimated": self.rack_weight_kg_estimated,
-        } 
+        }
     
 
     def __repr__(self) -> str:
@@ -0,0 +1,35 @@
+'''
+@file: footprint.py
+@author: airside-tech
+
+Tile footprint helpers shared by the objects that occupy rectangular blocks of room tiles
+(data racks and obstacles). Everything is computed from the current position and size on each
+call, so nothing goes stale when those attributes change.
+
+'''
+
+import numpy as np
+
+
+def tile_footprint(position_x: int, position_y: int, width_tiles: int, depth_tiles: int) -> list[tuple[int, int]]:
+    '''Return the (x, y) tiles covered by a width_tiles x depth_tiles block, in x-major order.'''
+    return [
+        (position_x + dx, position_y + dy)
+        for dx in range(width_tiles)
+        for dy in range(depth_tiles)
+    ]
+
+
+def tile_footprint_array(position_x: int, position_y: int, width_tiles: int, depth_tiles: int) -> np.ndarray:
+    '''Return the covered tiles as an (N, 2) int32 array of (x, y) rows, in x-major order.'''
+    xs, ys = np.meshgrid(
+        np.arange(width_tiles, dtype=np.int32) + position_x,
+        np.arange(depth_tiles, dtype=np.int32) + position_y,
+        indexing="ij",
+    )
+    return np.stack([xs.ravel(), ys.ravel()], axis=1)
+
+
+def tile_bounds(position_x: int, position_y: int, width_tiles: int, depth_tiles: int) -> tuple[int, int, int, int]:
+    '''Return the (min_x, min_y, max_x, max_y) tiles covered by the block.'''
+    return (position_x, position_y, position_x + width_tiles - 1, position_y + depth_tiles - 1)
@@ -10,6 +10,17 @@ it defaults to 0 (straight section).
 
 
 class Section:
+    __slots__ = (
+        "section_id",
+        "x_coord",
+        "y_coord",
+        "length",
+        "orientation",
+        "width",
+        "material",
+        "curved_degree",
+    )
+
     def __init__(
         self,
         section_id: str,
@@ -40,16 +51,46 @@ class Section:
 class Ladder:
     def __init__(self, ladder_id: str) -> None:
         self.ladder_id = ladder_id
-        self.sections: list[Section] = []  # List of Section objects
+        # Sections are only changed through the methods below, which keep _total_length in step
+        self._sections: list[Section] = []  # List of Section objects
+        self._sections_view: tuple[Section, ...] | None = ()  # Read-only copy handed out by sections
+        self._total_length = 0.0  # Running sum of section lengths
+
+    @property
+    def sections(self) -> tuple["Section", ...]:
+        # Read-only snapshot of the sections, rebuilt on first access after a change
+        if self._sections_view is None:
+            self._sections_view = tuple(self._sections)
+        return self._sections_view
 
     def add_section(self, section: "Section") -> None:
         # Add a Section object to the ladder
-        self.sections.append(section)
+        self._sections.append(section)
+        self._sections_view = None
+        self._total_length += section.length
+
+    def add_sections(self, sections) -> None:
+        # Add several Section objects at once
+        sections = list(sections)
+        self._sections.extend(sections)
+        self._sections_view = None
+        self._total_length += sum(s.length for s in sections)
 
     def remove_section(self, section_id: str) -> None:
         # Remove section by its ID
-        self.sections = [s for s in self.sections if s.section_id != section_id]
+        self._total_length -= sum(s.length for s in self._sections if s.section_id == section_id)
+        self._sections = [s for s in self._sections if s.section_id != section_id]
+        self._sections_view = None
+        if not self._sections:
+            self._total_length = 0.0  # Drop any accumulated rounding error
+
+    def pop_section(self, index: int = -1) -> "Section":
+        # Remove and return the section at the given position (last section by default)
+        section = self._sections.pop(index)
+        self._sections_view = None
+        self._total_length = self._total_length - section.length if self._sections else 0.0
+        return section
 
     @property
     def total_length(self) -> float:
-        return sum(section.length for section in self.sections)
\ No newline at end of file
+        return self._total_length
@@ -7,7 +7,21 @@ support beams, or any other non-movable structures that may impact ladder placem
 
 '''
 
+import numpy as np
+
+from footprint import tile_bounds, tile_footprint, tile_footprint_array
+
+
 class Obstacle:
+    __slots__ = (
+        "obstacle_id",
+        "position_x",
+        "position_y",
+        "width_tiles",
+        "depth_tiles",
+        "height",
+    )
+
     def __init__(self, obstacle_id: str, position_x: int, position_y: int,
                  width_tiles: int = 1, depth_tiles: int = 1, height: float = 1.0) -> None:
         self.obstacle_id = obstacle_id
@@ -31,11 +45,15 @@ class Obstacle:
     
     def get_tile_footprint(self) -> list[tuple[int, int]]:
         """Get a list of all tile coordinates occupied by this obstacle."""
-        tiles = []
-        for dx in range(self.width_tiles):
-            for dy in range(self.depth_tiles):
-                tiles.append((self.position_x + dx, self.position_y + dy))
-        return tiles
+        return tile_footprint(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
+
+    def get_tile_footprint_array(self) -> np.ndarray:
+        """Return the occupied tiles as an (N, 2) int32 array of (x, y) rows."""
+        return tile_footprint_array(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
     
+    def get_tile_bounds(self) -> tuple[int, int, int, int]:
+        """Return the (min_x, min_y, max_x, max_y) tiles covered by this obstacle."""
+        return tile_bounds(self.position_x, self.position_y, self.width_tiles, self.depth_tiles)
+
     def __repr__(self) -> str:
         return f"Obstacle(id={self.obstacle_id}, position=({self.position_x}, {self.position_y}), footprint={self.width_tiles}x{self.depth_tiles})"
@@ -7,6 +7,24 @@ Also includes methods to manage data racks and tile occupancy within the room.
 
 '''
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _try_place(mask: np.ndarray, x: int, y: int, w: int, d: int) -> bool:
+    '''
+    Stamp a w x d footprint at (x, y) into an occupancy mask if it is in bounds and free.
+    Returns False, leaving the mask untouched, when the footprint does not fit.
+    '''
+    if x < 0 or y < 0 or x + w > mask.shape[0] or y + d > mask.shape[1]:
+        return False
+    window = mask[x:x + w, y:y + d]
+    if window.any():
+        return False
+    window[...] = True
+    return True
+
+
 class Room:
     '''
     Represents a physical data center room with dimensions, tile grid, and data racks.'''
@@ -23,10 +41,11 @@ class Room:
         self.length: float = num_tiles_x * tile_size_xy  # default tile size in meters
         self.width: float = num_tiles_y * tile_size_xy   # default tile size in meters
 
-        # Establish a tile grid for the room. Each tile can be occupied or unoccupied.
-        self.tile_grid: list[list[bool]] = [
-            [False for _ in range(num_tiles_y)] for _ in range(num_tiles_x)
-        ]  # False indicates unoccupied tile
+        # Establish a tile grid for the room, indexed [x, y]. Each tile can be occupied or unoccupied.
+        # Collision checks and tile queries run as vectorized NumPy operations on slices of this array.
+        self.tile_grid: np.ndarray = np.zeros((num_tiles_x, num_tiles_y), dtype=np.bool_)  # False indicates unoccupied tile
+        self._occupied_count = 0  # Number of occupied tiles, kept in step with the mask
+        self._occupied_cache: list[tuple[int, int]] | None = None  # get_occupied_tiles() result
 
         self.data_racks = []  # List of DataRack objects in the room
         self.obstacles = []   # List of Obstacle objects in the room
@@ -42,6 +61,11 @@ class Room:
     def volume(self) -> float:
         """Calculate the volume of the room."""
         return self.length * self.width * self.height
+
+    @property
+    def occupied_tile_count(self) -> int:
+        """Number of occupied tiles in the room."""
+        return self._occupied_count
     
 
     def add_data_rack(self, rack) -> bool:
@@ -54,24 +78,28 @@ class Room:
         Returns:
             bool: True if rack was successfully placed, False if tiles are out of bounds or already occupied
         """
-        # Get all tiles this rack will occupy
-        footprint = rack.get_tile_footprint()
-        
-        # Check if all tiles are within bounds and unoccupied
-        for tile_x, tile_y in footprint:
-            if tile_x < 0 or tile_x >= self.num_tiles_x or tile_y < 0 or tile_y >= self.num_tiles_y:
-                return False  # Out of bounds
-            if self.tile_grid[tile_x][tile_y]:
-                return False  # Tile already occupied
-        
-        # All tiles are valid, mark them as occupied
-        for tile_x, tile_y in footprint:
-            self.tile_grid[tile_x][tile_y] = True
+        if not self._place_footprint(rack):
+            return False  # Out of bounds or tile already occupied
         
         # Store the rack reference
         self.data_racks.append(rack)
         return True
 
+    def add_data_racks(self, racks) -> list[bool]:
+        """
+        Add several data racks in one call.
+
+        Convenience wrapper around add_data_rack: racks are placed in order, so a rack overlapping an
+        earlier rack of the same batch is rejected just as with repeated add_data_rack calls.
+
+        Args:
+            racks: An iterable of DataRack objects to place in the room
+
+        Returns:
+            list[bool]: True for each rack that was successfully placed, in input order
+        """
+        return [self.add_data_rack(rack) for rack in racks]
+
     def remove_data_rack(self, rack) -> bool:
         """
         Remove a data rack from the room and free its tiles.
@@ -85,10 +113,7 @@ class Room:
             return False
         
         # Free all tiles occupied by this rack
-        footprint = rack.get_tile_footprint()
-        for tile_x, tile_y in footprint:
-            if 0 <= tile_x < self.num_tiles_x and 0 <= tile_y < self.num_tiles_y:
-                self.tile_grid[tile_x][tile_y] = False
+        self._free_footprint(rack)
         
         # Remove the rack reference
         self.data_racks.remove(rack)
@@ -97,28 +122,47 @@ class Room:
 
     def is_tile_occupied(self, tile_x: int, tile_y: int) -> bool:
         """Check if a specific tile is occupied."""
-        return self.tile_grid[tile_x][tile_y]  
+        return bool(self.tile_grid[tile_x, tile_y])
 
 
     def get_occupied_tiles(self) -> list[tuple[int, int]]:
         """Get a list of all occupied tiles in the room."""
-        occupied_tiles = []
-        for x in range(self.num_tiles_x):
-            for y in range(self.num_tiles_y):
-                if self.tile_grid[x][y]:
-                    occupied_tiles.append((x, y))
-        return occupied_tiles   
+        # The scan is cached until the next placement or removal
+        if self._occupied_cache is None:
+            xs, ys = np.nonzero(self.tile_grid)
+            self._occupied_cache = list(zip(xs.tolist(), ys.tolist()))
+        return list(self._occupied_cache)
 
 
     def get_unoccupied_tiles(self) -> list[tuple[int, int]]:
         """Get a list of all unoccupied tiles in the room."""
-        unoccupied_tiles = []
-        for x in range(self.num_tiles_x):
-            for y in range(self.num_tiles_y):
-                if not self.tile_grid[x][y]:
-                    unoccupied_tiles.append((x, y))
-        return unoccupied_tiles
+        xs, ys = np.nonzero(~self.tile_grid)
+        return list(zip(xs.tolist(), ys.tolist()))
     
+    def find_free_placement(self, width_tiles: int, depth_tiles: int) -> tuple[int, int] | None:
+        """
+        Find the first tile where a footprint of the given size fits without overlapping anything.
+
+        Every candidate window is tested in one vectorized pass over the occupancy mask.
+
+        Args:
+            width_tiles: Footprint size in x direction
+            depth_tiles: Footprint size in y direction
+
+        Returns:
+            tuple[int, int] | None: The (x, y) starting tile, or None if the footprint fits nowhere
+        """
+        if width_tiles < 1 or depth_tiles < 1:
+            return None
+        if width_tiles > self.num_tiles_x or depth_tiles > self.num_tiles_y:
+            return None
+
+        windows = sliding_window_view(self.tile_grid, (width_tiles, depth_tiles))
+        free = np.argwhere(~windows.any(axis=(2, 3)))
+        if free.size == 0:
+            return None
+        return (int(free[0, 0]), int(free[0, 1]))
+
     def add_obstacle(self, obstacle) -> bool:
         """
         Add an obstacle to the room and mark all occupied tiles.
@@ -129,19 +173,8 @@ class Room:
         Returns:
             bool: True if obstacle was successfully placed, False if tiles are out of bounds or already occupied
         """
-        # Get all tiles this obstacle will occupy
-        footprint = obstacle.get_tile_footprint()
-        
-        # Check if all tiles are within bounds and unoccupied
-        for tile_x, tile_y in footprint:
-            if tile_x < 0 or tile_x >= self.num_tiles_x or tile_y < 0 or tile_y >= self.num_tiles_y:
-                return False  # Out of bounds
-            if self.tile_grid[tile_x][tile_y]:
-                return False  # Tile already occupied
-        
-        # All tiles are valid, mark them as occupied
-        for tile_x, tile_y in footprint:
-            self.tile_grid[tile_x][tile_y] = True
+        if not self._place_footprint(obstacle):
+            return False  # Out of bounds or tile already occupied
         
         # Store the obstacle reference
         self.obstacles.append(obstacle)
@@ -161,11 +194,29 @@ class Room:
             return False
         
         # Free all tiles occupied by this obstacle
-        footprint = obstacle.get_tile_footprint()
-        for tile_x, tile_y in footprint:
-            if 0 <= tile_x < self.num_tiles_x and 0 <= tile_y < self.num_tiles_y:
-                self.tile_grid[tile_x][tile_y] = False
+        self._free_footprint(obstacle)
         
         # Remove the obstacle reference
         self.obstacles.remove(obstacle)
-        return True
\ No newline at end of file
+        return True
+
+
+    def _place_footprint(self, item) -> bool:
+        """Mark the tiles of a rack or obstacle as occupied if they are in bounds and free."""
+        if not _try_place(self.tile_grid, item.position_x, item.position_y,
+                          item.width_tiles, item.depth_tiles):
+            return False
+
+        self._occupied_count += item.width_tiles * item.depth_tiles
+        self._occupied_cache = None
+        return True
+
+    def _free_footprint(self, item) -> None:
+        """Mark the in-bounds tiles of a rack or obstacle as unoccupied."""
+        x, y = max(item.position_x, 0), max(item.position_y, 0)
+        x_end, y_end = item.position_x + item.width_tiles, item.position_y + item.depth_tiles
+        if x_end > x and y_end > y:
+            window = self.tile_grid[x:x_end, y:y_end]
+            self._occupied_count -= int(window.sum())
+            window[...] = False
+        self._occupied_cache = None
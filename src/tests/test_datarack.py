@@ -4,9 +4,14 @@
 Unit tests for the DataRack class
 '''
 
+import math
+
 import pytest
 from datarack import DataRack
 
+# Expected per-rack-unit conversion factors (kept independent of the DataRack constants)
+H_PER_U, IN_PER_U, KG_PER_U = 0.04445, 1.75, 4.5
+
 
 class TestDataRackCreation:
     """Test DataRack initialization and basic properties"""
@@ -18,16 +23,29 @@ class TestDataRackCreation:
         assert rack.position_x == 2
         assert rack.position_y == 3
         assert rack.rack_units == 42
-        # Derived values
-        assert pytest.approx(rack.rack_height_meters, rel=1e-6) == 42 * 0.04445
-        assert pytest.approx(rack.rack_height_inches, rel=1e-6) == 42 * 1.75
-        assert pytest.approx(rack.rack_weight_kg_estimated, rel=1e-6) == 42 * 4.5
 
-    def test_datarack_creation_zero_units(self):
-        rack = DataRack("RACKZERO", 0, 0, 0)
-        assert rack.rack_units == 0
-        assert rack.get_rack_height_meters() == 0.0
-        assert rack.get_rack_weight_estimated() == 0.0
+
+class TestDataRackDerivedValues:
+    """Test values derived from the rack unit count, through both the attributes and the getters"""
+
+    @pytest.mark.parametrize(
+        "rack_id,pos,units",
+        [
+            pytest.param("RACK01", (2, 3), 42, id="full_height"),
+            pytest.param("RACKZERO", (0, 0), 0, id="zero_units"),
+            pytest.param("RACK04", (0, 0), 5, id="5U"),
+            pytest.param("RACK05", (0, 0), 8, id="8U"),
+        ],
+    )
+    def test_derived_values(self, rack_id, pos, units):
+        expected_h, expected_in, expected_kg = units * H_PER_U, units * IN_PER_U, units * KG_PER_U
+        rack = DataRack(rack_id, *pos, units)
+        assert rack.rack_units == units
+        assert math.isclose(rack.rack_height_meters, expected_h, rel_tol=1e-6, abs_tol=1e-9)
+        assert math.isclose(rack.get_rack_height_meters(), expected_h, rel_tol=1e-6, abs_tol=1e-9)
+        assert math.isclose(rack.rack_height_inches, expected_in, rel_tol=1e-6, abs_tol=1e-9)
+        assert math.isclose(rack.rack_weight_kg_estimated, expected_kg, rel_tol=1e-6, abs_tol=1e-9)
+        assert math.isclose(rack.get_rack_weight_estimated(), expected_kg, rel_tol=1e-6, abs_tol=1e-9)
 
 
 class TestDataRackGetters:
@@ -41,14 +59,6 @@ class TestDataRackGetters:
         rack = DataRack("RACK03", 5, 7, 20)
         assert rack.get_rack_position() == (5, 7)
 
-    def test_get_rack_height_meters(self):
-        rack = DataRack("RACK04", 0, 0, 5)
-        assert pytest.approx(rack.get_rack_height_meters(), rel=1e-6) == 5 * 0.04445
-
-    def test_get_rack_weight_estimated(self):
-        rack = DataRack("RACK05", 0, 0, 8)
-        assert pytest.approx(rack.get_rack_weight_estimated(), rel=1e-6) == 8 * 4.5
-
     def test_get_rack_units(self):
         rack = DataRack("RACK06", 3, 4, 12)
         assert rack.get_rack_units() == 12
@@ -61,9 +71,9 @@ class TestDataRackSetters:
         rack = DataRack("RACK07", 0, 0, 10)
         rack.set_rack_units(20)
         assert rack.rack_units == 20
-        assert pytest.approx(rack.rack_height_meters, rel=1e-6) == 20 * 0.04445
-        assert pytest.approx(rack.rack_height_inches, rel=1e-6) == 20 * 1.75
-        assert pytest.approx(rack.rack_weight_kg_estimated, rel=1e-6) == 20 * 4.5
+        assert math.isclose(rack.rack_height_meters, 20 * H_PER_U, rel_tol=1e-6)
+        assert math.isclose(rack.rack_height_inches, 20 * IN_PER_U, rel_tol=1e-6)
+        assert math.isclose(rack.rack_weight_kg_estimated, 20 * KG_PER_U, rel_tol=1e-6)
 
     def test_set_rack_position(self):
         rack = DataRack("RACK08", 2, 2, 5)
@@ -72,39 +82,51 @@ class TestDataRackSetters:
         assert rack.position_y == 15
         assert rack.get_rack_position() == (10, 15)
 
+    def test_set_rack_position_updates_footprint(self):
+        rack = DataRack("RACK17", 0, 0, 42, width_tiles=2, depth_tiles=1)
+        rack.set_rack_position(4, 5)
+        assert rack.get_tile_footprint() == [(4, 5), (5, 5)]
+
 
 class TestDataRackTileFootprint:
     """Test tile footprint calculation"""
 
-    def test_get_tile_footprint_single_tile(self):
-        rack = DataRack("RACK11", 2, 3, 42, width_tiles=1, depth_tiles=1)
-        footprint = rack.get_tile_footprint()
-        assert footprint == [(2, 3)]
-
-    def test_get_tile_footprint_2x2(self):
-        rack = DataRack("RACK12", 5, 6, 42, width_tiles=2, depth_tiles=2)
-        footprint = rack.get_tile_footprint()
-        expected = [(5, 6), (5, 7), (6, 6), (6, 7)]
-        assert set(footprint) == set(expected)
-
-    def test_get_tile_footprint_3x1(self):
-        rack = DataRack("RACK13", 1, 1, 20, width_tiles=3, depth_tiles=1)
-        footprint = rack.get_tile_footprint()
-        expected = [(1, 1), (2, 1), (3, 1)]
-        assert footprint == expected
-
-    def test_get_tile_footprint_1x4(self):
-        rack = DataRack("RACK14", 0, 0, 20, width_tiles=1, depth_tiles=4)
-        footprint = rack.get_tile_footprint()
-        expected = [(0, 0), (0, 1), (0, 2), (0, 3)]
-        assert footprint == expected
-
-    def test_default_footprint_is_1x1(self):
-        rack = DataRack("RACK15", 10, 10, 42)
-        footprint = rack.get_tile_footprint()
-        assert footprint == [(10, 10)]
-        assert rack.width_tiles == 1
-        assert rack.depth_tiles == 1
+    @pytest.mark.parametrize(
+        "x,y,dims,expected",
+        [
+            (2, 3, {"width_tiles": 1, "depth_tiles": 1}, [(2, 3)]),
+            (5, 6, {"width_tiles": 2, "depth_tiles": 2}, [(5, 6), (5, 7), (6, 6), (6, 7)]),
+            (1, 1, {"width_tiles": 3, "depth_tiles": 1}, [(1, 1), (2, 1), (3, 1)]),
+            (0, 0, {"width_tiles": 1, "depth_tiles": 4}, [(0, 0), (0, 1), (0, 2), (0, 3)]),
+            (10, 10, {}, [(10, 10)]),  # Default footprint is 1x1
+        ],
+    )
+    def test_get_tile_footprint(self, x, y, dims, expected):
+        rack = DataRack("RACK11", x, y, 42, **dims)
+        assert rack.get_tile_footprint() == expected
+        assert rack.width_tiles * rack.depth_tiles == len(expected)
+
+    def test_get_tile_bounds(self):
+        rack = DataRack("RACK19", 5, 6, 42, width_tiles=3, depth_tiles=2)
+        assert rack.get_tile_bounds() == (5, 6, 7, 7)
+        rack.set_rack_position(0, 1)
+        assert rack.get_tile_bounds() == (0, 1, 2, 2)
+
+    def test_footprint_follows_attribute_assignment(self):
+        rack = DataRack("RACK23", 1, 1, 42, width_tiles=2, depth_tiles=2)
+        rack.width_tiles = 3
+        rack.position_y = 0
+        assert rack.get_tile_footprint() == [(1, 0), (1, 1), (2, 0), (2, 1), (3, 0), (3, 1)]
+        assert rack.get_tile_bounds() == (1, 0, 3, 1)
+        assert rack.get_tile_footprint_array().shape == (6, 2)
+
+    def test_get_tile_footprint_array(self):
+        rack = DataRack("RACK20", 2, 3, 42, width_tiles=2, depth_tiles=3)
+        footprint = rack.get_tile_footprint_array()
+        assert footprint.shape == (6, 2)
+        assert [tuple(tile) for tile in footprint.tolist()] == rack.get_tile_footprint()
+        rack.set_rack_position(0, 0)
+        assert rack.get_tile_footprint_array().tolist()[-1] == [1, 2]
 
 
 class TestDataRackInfoAndRepr:
@@ -119,9 +141,9 @@ class TestDataRackInfoAndRepr:
         assert info["rack_units"] == 3
         assert info["width_tiles"] == 1
         assert info["depth_tiles"] == 1
-        assert pytest.approx(info["rack_height_meters"], rel=1e-6) == 3 * 0.04445
-        assert pytest.approx(info["rack_height_inches"], rel=1e-6) == 3 * 1.75
-        assert pytest.approx(info["rack_weight_kg_estimated"], rel=1e-6) == 3 * 4.5
+        assert math.isclose(info["rack_height_meters"], 3 * H_PER_U, rel_tol=1e-6)
+        assert math.isclose(info["rack_height_inches"], 3 * IN_PER_U, rel_tol=1e-6)
+        assert math.isclose(info["rack_weight_kg_estimated"], 3 * KG_PER_U, rel_tol=1e-6)
 
     def test_get_rack_info_with_custom_footprint(self):
         rack = DataRack("RACK16", 5, 5, 20, width_tiles=2, depth_tiles=3)
@@ -129,6 +151,26 @@ class TestDataRackInfoAndRepr:
         assert info["width_tiles"] == 2
         assert info["depth_tiles"] == 3
 
+    def test_get_rack_info_refreshed_after_setters(self):
+        rack = DataRack("RACK18", 1, 1, 10)
+        assert rack.get_rack_info()["rack_units"] == 10
+
+        rack.set_rack_units(20)
+        rack.set_rack_position(4, 6)
+        info = rack.get_rack_info()
+        assert info["rack_units"] == 20
+        assert info["position_x"] == 4
+        assert info["position_y"] == 6
+        assert math.isclose(info["rack_height_meters"], 20 * H_PER_U, rel_tol=1e-6)
+
+    def test_get_rack_info_returns_fresh_dict(self):
+        rack = DataRack("RACK22", 0, 0, 10)
+        rack.get_rack_info()["rack_units"] = 1
+        assert rack.get_rack_info()["rack_units"] == 10
+
+        rack.rack_units = 12
+        assert rack.get_rack_info()["rack_units"] == 12
+
     def test_repr_contains_key_fields(self):
         rack = DataRack("RACK10", 9, 8, 7)
         rep = repr(rack)
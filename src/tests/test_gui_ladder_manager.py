@@ -0,0 +1,196 @@
+'''
+@file: test_gui_ladder_manager.py
+@author: airside-tech
+
+Headless tests for the pygame GUI (SDL dummy video driver, no window is shown)
+'''
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+# gui_ladder_manager.py lives in the repository root, next to src/
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import gui_ladder_manager as gui_module  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = gui_module.LadderManagerGUI()
+    yield app
+    app._io_executor.shutdown(wait=True)
+
+
+class TestSectionHitTesting:
+    """Test clicking ladder sections through the tile index"""
+
+    def test_click_within_tolerance_selects_section(self, app):
+        app.add_ladder_segment((2, 2), (6, 2))
+        section = app.ladders[0].sections[0]
+        x, y = app.get_tile_center(4, 2)
+
+        assert app.get_section_at_position((x, y)) == (section, app.ladders[0])
+        # Tolerance is 10 px inclusive, at every zoom level
+        for zoom in (0.3, 1.0, 2.7):
+            app.set_zoom(zoom)
+            x, y = app.get_tile_center(4, 2)
+            assert app.get_section_at_position((x, y + 10))[0] is section
+            assert app.get_section_at_position((x, y - 11))[0] is None
+            end_x = app.get_tile_center(2, 2)[0] + int(section.length * app.TILE_SIZE)
+            assert app.get_section_at_position((end_x + 10, y))[0] is section
+            assert app.get_section_at_position((end_x + 11, y))[0] is None
+
+    def test_nearest_section_wins(self, app):
+        app.add_ladder_segment((4, 0), (4, 5))  # Vertical, added first
+        app.add_ladder_segment((2, 2), (6, 2))  # Horizontal, crosses it at (4, 2)
+        vertical, horizontal = app.ladders[0].sections
+        x, y = app.get_tile_center(4, 2)
+
+        assert app.get_section_at_position((x + 6, y + 2))[0] is horizontal
+        assert app.get_section_at_position((x + 2, y + 6))[0] is vertical
+
+    def test_deleted_section_is_unindexed(self, app):
+        app.add_ladder_segment((2, 2), (6, 2))
+        section = app.ladders[0].sections[0]
+        pos = app.get_tile_center(4, 2)
+
+        app.handle_events([
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DELETE, mod=0, unicode="", scancode=0),
+        ])
+
+        assert app.ladders == []
+        assert app.get_section_at_position(pos) == (None, None)
+        assert all(entry[0] is not section for entries in app._section_index.values() for entry in entries)
+        assert section not in app._section_to_ladder
+
+
+def _motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def _wheel(x, y):
+    return pygame.event.Event(pygame.MOUSEWHEEL, x=x, y=y, flipped=False)
+
+
+def _click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+
+class TestMouseEventCoalescing:
+    """Test merging of mouse motion and wheel runs before dispatch"""
+
+    coalesce = staticmethod(gui_module.LadderManagerGUI._coalesce_mouse_events)
+
+    def test_motion_run_keeps_last_position(self):
+        events = self.coalesce([_motion((1, 1)), _motion((5, 5)), _motion((9, 2))])
+        assert [(e.type, e.pos) for e in events] == [(pygame.MOUSEMOTION, (9, 2))]
+
+    def test_wheel_run_sums_deltas(self):
+        events = self.coalesce([_wheel(0, 1), _wheel(1, 2), _wheel(0, -1)])
+        assert len(events) == 1
+        assert (events[0].type, events[0].x, events[0].y) == (pygame.MOUSEWHEEL, 1, 2)
+        assert events[0].flipped is False
+
+    def test_buttons_split_runs_in_order(self):
+        first, second = _click((3, 3)), _click((4, 4), button=3)
+        events = self.coalesce([
+            _motion((1, 1)), _motion((3, 3)), first,
+            _wheel(0, 1), _wheel(0, 1), second, _motion((7, 7)),
+        ])
+
+        assert [e.type for e in events] == [
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION,
+        ]
+        assert events[0].pos == (3, 3)
+        assert events[1] is first and events[3] is second
+        assert events[2].y == 2
+        assert events[4].pos == (7, 7)
+
+    def test_empty_and_unrelated_events_pass_through(self):
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a", scancode=0)
+        assert self.coalesce([]) == []
+        assert self.coalesce([key, key]) == [key, key]
+
+
+_VALID_LAYOUT = {
+    "room": {"room_id": "DC-TEST", "num_tiles_x": 6, "num_tiles_y": 5, "height": 3.0},
+    "racks": [{"rack_id": "RACK-T1", "position_x": 0, "position_y": 0, "rack_units": 42}],
+    "ladders": [
+        {
+            "ladder_id": "LAD-T1",
+            "sections": [{"x_coord": 1.0, "y_coord": 3.0, "length": 3.0, "orientation": "horizontal"}],
+        }
+    ],
+}
+
+
+def _load_async(app, path):
+    """Run a background load to completion and dispatch its LAYOUT_IO_DONE event"""
+    app.load_layout_async(str(path))
+    app._layout_io.result()
+    app.handle_events()
+
+
+class TestLayoutLoading:
+    """Test applying loaded layouts, including malformed ones"""
+
+    def test_build_layout_leaves_current_layout_alone(self, app):
+        room, ladders = app.room, app.ladders
+        new_room, new_ladders, warnings = app._build_layout(_VALID_LAYOUT)
+
+        assert app.room is room and app.ladders is ladders
+        assert new_room.room_id == "DC-TEST"
+        assert [r.rack_id for r in new_room.data_racks] == ["RACK-T1"]
+        assert [s.section_id for s in new_ladders[0].sections] == ["SEC-001"]
+        assert warnings == []
+
+    def test_async_load_swaps_in_valid_layout(self, app, tmp_path):
+        path = tmp_path / "layout.json"
+        gui_module.LadderManagerGUI._write_layout_file(_VALID_LAYOUT, str(path))
+
+        _load_async(app, path)
+
+        assert app.room.room_id == "DC-TEST"
+        assert [ld.ladder_id for ld in app.ladders] == ["LAD-T1"]
+        section = app.ladders[0].sections[0]
+        assert app.get_section_at_position(app.get_tile_center(2, 3))[0] is section
+        assert app._status_log[-1].startswith("Loaded layout from")
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"room": {}}, id="missing_room_fields"),
+            pytest.param([], id="not_an_object"),
+            pytest.param({**_VALID_LAYOUT, "racks": [{"rack_id": "R", "position_x": "a"}]}, id="bad_rack"),
+            pytest.param({**_VALID_LAYOUT, "ladders": [{"sections": [{"x_coord": 1.0}]}]}, id="bad_section"),
+        ],
+    )
+    def test_async_load_keeps_layout_on_invalid_data(self, app, tmp_path, data):
+        app.add_ladder_segment((2, 2), (6, 2))
+        room, ladders = app.room, list(app.ladders)
+        section = ladders[0].sections[0]
+        path = tmp_path / "layout.json"
+        gui_module.LadderManagerGUI._write_layout_file(data, str(path))
+
+        _load_async(app, path)
+
+        assert app.room is room
+        assert app.ladders == ladders
+        assert app.get_section_at_position(app.get_tile_center(4, 2))[0] is section
+        assert "invalid data" in app._status_log[-1]
+
+    def test_apply_layout_raises_without_side_effects(self, app):
+        room = app.room
+        with pytest.raises(KeyError):
+            app.apply_layout({"room": {}})
+        assert app.room is room
@@ -5,29 +5,31 @@
 Unit tests for the Ladder class
 '''
 
+import math
+
 import pytest
 from ladder import Ladder, Section
 
 
+def _mk_section(i, length, orient="horizontal", x=0.0, y=0.0, **kwargs):
+    """Build section SEC<i> through the Section constructor; extra keywords go to Section"""
+    return Section(f"SEC{i:03d}", x, y, length, orient, **kwargs)
+
+
 class TestLadderCreation:
     """Test Ladder initialization"""
     
-    def test_ladder_creation(self):
-        """Test creating a basic ladder"""
-        ladder = Ladder(ladder_id="LAD001")
+    @pytest.mark.parametrize("ladder_id", ["LAD001", "LAD_NORTH_01", "LAD_SOUTH_02"])
+    def test_ladder_creation(self, ladder_id):
+        """Test creating an empty ladder with a given ID"""
+        ladder = Ladder(ladder_id)
         
-        assert ladder.ladder_id == "LAD001"
-        assert isinstance(ladder.sections, list)
-        assert len(ladder.sections) == 0
+        assert ladder.ladder_id == ladder_id
+        assert ladder.sections == ()
 
-    def test_ladder_with_different_ids(self):
-        """Test creating ladders with different IDs"""
-        ladder1 = Ladder("LAD_NORTH_01")
-        ladder2 = Ladder("LAD_SOUTH_02")
-        
-        assert ladder1.ladder_id == "LAD_NORTH_01"
-        assert ladder2.ladder_id == "LAD_SOUTH_02"
-        assert ladder1.ladder_id != ladder2.ladder_id
+    def test_ladders_keep_distinct_ids(self):
+        """Test that separately created ladders keep their own IDs"""
+        assert Ladder("LAD_NORTH_01").ladder_id != Ladder("LAD_SOUTH_02").ladder_id
 
 
 class TestLadderSections:
@@ -36,7 +38,7 @@ class TestLadderSections:
     def test_add_single_section(self):
         """Test adding a single section to ladder"""
         ladder = Ladder("LAD002")
-        section = Section("SEC001", 0.0, 0.0, 1.5, "horizontal")
+        section = _mk_section(1, 1.5)
         
         ladder.add_section(section)
         
@@ -46,8 +48,8 @@ class TestLadderSections:
     def test_remove_section(self):
         """Test removing a section from ladder"""
         ladder = Ladder("LAD018")
-        section1 = Section("SEC001", 0.0, 0.0, 1.5, "horizontal")
-        section2 = Section("SEC002", 1.5, 0.0, 1.5, "horizontal")
+        section1 = _mk_section(1, 1.5)
+        section2 = _mk_section(2, 1.5, x=1.5)
         
         ladder.add_section(section1)
         ladder.add_section(section2)
@@ -58,14 +60,27 @@ class TestLadderSections:
         
         assert len(ladder.sections) == 1
         assert ladder.sections[0] == section2
+
+    def test_pop_section(self):
+        """Test popping sections by position"""
+        ladder = Ladder("LAD019")
+        section1 = _mk_section(1, 1.5)
+        section2 = _mk_section(2, 1.5, x=1.5)
+        section3 = _mk_section(3, 1.5, "vertical", x=3.0)
+        for section in (section1, section2, section3):
+            ladder.add_section(section)
+
+        assert ladder.pop_section() is section3
+        assert ladder.pop_section(0) is section1
+        assert ladder.sections == (section2,)
         
 
     def test_add_multiple_sections(self):
         """Test adding multiple sections to ladder"""
         ladder = Ladder("LAD003")
-        section1 = Section("SEC001", 0.0, 0.0, 1.5, "horizontal")
-        section2 = Section("SEC002", 1.5, 0.0, 1.5, "horizontal")
-        section3 = Section("SEC003", 3.0, 0.0, 1.5, "vertical")
+        section1 = _mk_section(1, 1.5)
+        section2 = _mk_section(2, 1.5, x=1.5)
+        section3 = _mk_section(3, 1.5, "vertical", x=3.0)
         
         ladder.add_section(section1)
         ladder.add_section(section2)
@@ -79,55 +94,52 @@ class TestLadderSections:
     def test_add_sections_maintains_order(self):
         """Test that sections maintain insertion order"""
         ladder = Ladder("LAD004")
-        sections = [
-            Section(f"SEC{i:03d}", 0.0, 0.0, 1.5, "horizontal")
-            for i in range(1, 6)
-        ]
+        sections = [_mk_section(i, 1.5) for i in range(1, 6)]
         
-        for section in sections:
-            ladder.add_section(section)
+        ladder.add_sections(sections)
         
         for i, section in enumerate(ladder.sections):
             assert section.section_id == f"SEC{i+1:03d}"
 
+    def test_add_sections_matches_add_section(self):
+        """Test that bulk adding matches adding sections one at a time"""
+        single = Ladder("LAD025")
+        bulk = Ladder("LAD026")
+        sections = [
+            _mk_section(1, 1.5),
+            _mk_section(2, 2.0, "vertical", x=1.5, bend_degree=45.0),
+        ]
+        for section in sections:
+            single.add_section(section)
+        bulk.add_sections(iter(sections))
+        bulk.add_sections([])
+
+        assert bulk.sections == single.sections
+        assert bulk.total_length == single.total_length
+
 
 class TestLadderTotalLength:
     """Test Ladder total_length property"""
     
-    def test_total_length_empty_ladder(self):
-        """Test total length of ladder with no sections"""
+    @pytest.mark.parametrize(
+        "lengths",
+        [
+            [],
+            [1.5],
+            [1.5, 2.0, 1.0],
+            [0.5, 1.0, 1.5, 2.0, 0.75],
+        ],
+    )
+    def test_total_length(self, lengths):
+        """Test total length for empty, single and multi-section ladders"""
         ladder = Ladder("LAD005")
-        
-        assert ladder.total_length == 0.0
-
-    def test_total_length_single_section(self):
-        """Test total length with single section"""
-        ladder = Ladder("LAD006")
-        section = Section("SEC001", 0.0, 0.0, 1.5, "horizontal")
-        ladder.add_section(section)
-        
-        assert ladder.total_length == 1.5
-
-    def test_total_length_multiple_sections(self):
-        """Test total length with multiple sections"""
-        ladder = Ladder("LAD007")
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 1.5, "horizontal"))
-        ladder.add_section(Section("SEC002", 1.5, 0.0, 2.0, "horizontal"))
-        ladder.add_section(Section("SEC003", 3.5, 0.0, 1.0, "vertical"))
-        
-        assert ladder.total_length == 4.5
+        ladder.add_sections(
+            _mk_section(i, length, "horizontal" if i % 2 == 0 else "vertical")
+            for i, length in enumerate(lengths)
+        )
 
-    def test_total_length_with_various_lengths(self):
-        """Test total length calculation with various section lengths"""
-        ladder = Ladder("LAD008")
-        lengths = [0.5, 1.0, 1.5, 2.0, 0.75]
-        
-        for i, length in enumerate(lengths):
-            section = Section(f"SEC{i:03d}", 0.0, 0.0, length, "horizontal")
-            ladder.add_section(section)
-        
-        expected_total = sum(lengths)
-        assert ladder.total_length == expected_total
+        # fsum is the exactly rounded sum, a reference independent of how Ladder accumulates
+        assert ladder.total_length == pytest.approx(math.fsum(lengths))
 
     def test_total_length_updates_after_adding_sections(self):
         """Test that total_length updates dynamically"""
@@ -135,15 +147,46 @@ class TestLadderTotalLength:
         
         assert ladder.total_length == 0.0
         
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 1.0, "horizontal"))
+        ladder.add_section(_mk_section(1, 1.0))
         assert ladder.total_length == 1.0
         
-        ladder.add_section(Section("SEC002", 1.0, 0.0, 2.0, "horizontal"))
+        ladder.add_section(_mk_section(2, 2.0, x=1.0))
         assert ladder.total_length == 3.0
         
-        ladder.add_section(Section("SEC003", 3.0, 0.0, 0.5, "horizontal"))
+        ladder.add_section(_mk_section(3, 0.5, x=3.0))
         assert ladder.total_length == 3.5
 
+    def test_total_length_updates_after_removing_sections(self):
+        """Test that total_length follows removed and popped sections"""
+        ladder = Ladder("LAD023")
+        ladder.add_section(_mk_section(1, 1.0))
+        ladder.add_section(_mk_section(2, 2.0, x=1.0))
+        ladder.add_section(_mk_section(3, 0.5, x=3.0))
+
+        ladder.remove_section("SEC002")
+        assert ladder.total_length == pytest.approx(1.5)
+
+        ladder.pop_section()
+        assert ladder.total_length == pytest.approx(1.0)
+
+        ladder.pop_section()
+        assert ladder.total_length == 0.0
+
+
+    def test_sections_cannot_be_mutated_directly(self):
+        """Test that sections is read-only, so total_length cannot fall out of step"""
+        ladder = Ladder("LAD027")
+        ladder.add_section(_mk_section(1, 2.0))
+
+        with pytest.raises(AttributeError):
+            ladder.sections.append(_mk_section(2, 1.0))
+        with pytest.raises(TypeError):
+            del ladder.sections[0]
+        with pytest.raises(AttributeError):
+            ladder.sections = []
+        assert len(ladder.sections) == 1
+        assert ladder.total_length == 2.0
+
 
 class TestLadderOrientations:
     """Test Ladder with different section orientations"""
@@ -151,70 +194,51 @@ class TestLadderOrientations:
     def test_ladder_with_horizontal_sections(self):
         """Test ladder composed of horizontal sections"""
         ladder = Ladder("LAD010")
-        for i in range(3):
-            section = Section(
-                f"SEC{i:03d}", float(i*1.5), 0.0, 1.5, "horizontal"
-            )
-            ladder.add_section(section)
+        ladder.add_sections(_mk_section(i, 1.5, x=i * 1.5) for i in range(3))
         
-        assert all(s.orientation == "horizontal" for s in ladder.sections)
+        assert {s.orientation for s in ladder.sections} == {"horizontal"}
         assert ladder.total_length == 4.5
 
     def test_ladder_with_vertical_sections(self):
         """Test ladder composed of vertical sections"""
         ladder = Ladder("LAD011")
-        for i in range(3):
-            section = Section(
-                f"SEC{i:03d}", 0.0, float(i*1.5), 1.5, "vertical"
-            )
-            ladder.add_section(section)
+        ladder.add_sections(_mk_section(i, 1.5, "vertical", y=i * 1.5) for i in range(3))
         
-        assert all(s.orientation == "vertical" for s in ladder.sections)
+        assert {s.orientation for s in ladder.sections} == {"vertical"}
         assert ladder.total_length == 4.5
 
     def test_ladder_with_mixed_orientations(self):
         """Test ladder with both horizontal and vertical sections"""
         ladder = Ladder("LAD012")
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 1.5, "horizontal"))
-        ladder.add_section(Section("SEC002", 1.5, 0.0, 2.0, "vertical"))
-        ladder.add_section(Section("SEC003", 1.5, 2.0, 1.5, "horizontal"))
+        ladder.add_section(_mk_section(1, 1.5))
+        ladder.add_section(_mk_section(2, 2.0, "vertical", x=1.5))
+        ladder.add_section(_mk_section(3, 1.5, x=1.5, y=2.0))
         
-        orientations = [s.orientation for s in ladder.sections]
-        assert "horizontal" in orientations
-        assert "vertical" in orientations
+        assert {s.orientation for s in ladder.sections} == {"horizontal", "vertical"}
         assert ladder.total_length == 5.0
 
 
 class TestLadderWithCurvedSections:
     """Test Ladder with curved sections"""
     
-    def test_ladder_with_bent_sections(self):
-        """Test ladder containing bent sections"""
+    @pytest.mark.parametrize(
+        "bends,lengths,expected_total",
+        [
+            ([0.0, 15.0, -10.0], [1.5, 1.5, 1.5], 4.5),
+            ([None, 25.0], [2.0, 1.5], 3.5),  # None keeps the straight default
+        ],
+    )
+    def test_ladder_with_bent_sections(self, bends, lengths, expected_total):
+        """Test that bent sections keep their bend and count toward total_length"""
         ladder = Ladder("LAD013")
-        ladder.add_section(
-            Section("SEC001", 0.0, 0.0, 1.5, "horizontal", bend_degree=0.0)
-        )
-        ladder.add_section(
-            Section("SEC002", 1.5, 0.0, 1.5, "horizontal", bend_degree=15.0)
-        )
-        ladder.add_section(
-            Section("SEC003", 3.0, 0.0, 1.5, "horizontal", bend_degree=-10.0)
-        )
-        
-        bend_degrees = [s.curved_degree for s in ladder.sections]
-        assert 0.0 in bend_degrees
-        assert 15.0 in bend_degrees
-        assert -10.0 in bend_degrees
-
-    def test_ladder_total_length_includes_bent_sections(self):
-        """Test that total_length includes bent sections"""
-        ladder = Ladder("LAD014")
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 2.0, "horizontal"))
-        ladder.add_section(
-            Section("SEC002", 2.0, 0.0, 1.5, "horizontal", bend_degree=25.0)
-        )
+        x = 0.0
+        for i, (bend, length) in enumerate(zip(bends, lengths), start=1):
+            kwargs = {} if bend is None else {"bend_degree": bend}
+            ladder.add_section(_mk_section(i, length, x=x, **kwargs))
+            x += length
         
-        assert ladder.total_length == 3.5
+        assert ladder.total_length == expected_total
+        assert [s.curved_degree for s in ladder.sections] == [0.0 if b is None else b for b in bends]
 
 
 class TestLadderWithDifferentMaterials:
@@ -223,31 +247,23 @@ class TestLadderWithDifferentMaterials:
     def test_ladder_with_aluminum_sections(self):
         """Test ladder with aluminum sections"""
         ladder = Ladder("LAD015")
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 1.5, "horizontal"))
-        ladder.add_section(Section("SEC002", 1.5, 0.0, 1.5, "horizontal"))
+        ladder.add_section(_mk_section(1, 1.5))
+        ladder.add_section(_mk_section(2, 1.5, x=1.5))
         
-        assert all(s.material == "aluminum" for s in ladder.sections)
+        assert {s.material for s in ladder.sections} == {"aluminum"}
 
     def test_ladder_with_steel_sections(self):
         """Test ladder with steel sections"""
         ladder = Ladder("LAD016")
-        ladder.add_section(
-            Section("SEC001", 0.0, 0.0, 1.5, "horizontal", material="steel")
-        )
-        ladder.add_section(
-            Section("SEC002", 1.5, 0.0, 1.5, "horizontal", material="steel")
-        )
+        ladder.add_section(_mk_section(1, 1.5, material="steel"))
+        ladder.add_section(_mk_section(2, 1.5, x=1.5, material="steel"))
         
-        assert all(s.material == "steel" for s in ladder.sections)
+        assert {s.material for s in ladder.sections} == {"steel"}
 
     def test_ladder_with_mixed_materials(self):
         """Test ladder with mixed materials"""
         ladder = Ladder("LAD017")
-        ladder.add_section(Section("SEC001", 0.0, 0.0, 1.5, "horizontal"))
-        ladder.add_section(
-            Section("SEC002", 1.5, 0.0, 1.5, "horizontal", material="steel")
-        )
+        ladder.add_section(_mk_section(1, 1.5))
+        ladder.add_section(_mk_section(2, 1.5, x=1.5, material="steel"))
         
-        materials = [s.material for s in ladder.sections]
-        assert "aluminum" in materials
-        assert "steel" in materials
+        assert {s.material for s in ladder.sections} == {"aluminum", "steel"}
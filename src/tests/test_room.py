@@ -4,9 +4,24 @@
 Unit tests for the Room class and DataRack integration
 '''
 
+import math
+
+import numpy as np
 import pytest
 from room import Room
 from datarack import DataRack
+from obstacle import Obstacle
+
+# Expected footprints, built once at import
+_EXPECTED_2x3 = frozenset({(2, 3), (2, 4), (2, 5), (3, 3), (3, 4), (3, 5)})  # 2x3 rack at (2, 3)
+_EXPECTED_2x2_AT_4_4 = frozenset({(4, 4), (4, 5), (5, 4), (5, 5)})
+_ALL_3x3 = frozenset((x, y) for x in range(3) for y in range(3))
+
+
+@pytest.fixture
+def room10():
+    """Fresh, empty 10x10 room for each test (construction is a single np.zeros, cheaper than copying a prototype)"""
+    return Room("DC10", 10, 10, 3.0)
 
 
 class TestRoomCreation:
@@ -23,12 +38,10 @@ class TestRoomCreation:
 
     def test_room_tile_grid_initialized_empty(self):
         room = Room("DC02", 5, 4, 2.5)
-        assert len(room.tile_grid) == 5
-        assert len(room.tile_grid[0]) == 4
+        grid = np.asarray(room.tile_grid, dtype=bool)
+        assert grid.shape == (5, 4)
         # All tiles should start unoccupied
-        for x in range(5):
-            for y in range(4):
-                assert room.tile_grid[x][y] == False
+        assert not grid.any()
 
 
 class TestRoomProperties:
@@ -37,91 +50,72 @@ class TestRoomProperties:
     def test_room_area(self):
         room = Room("DC03", 10, 8, 3.0, tile_size_xy=0.6)
         expected_area = 10 * 0.6 * 8 * 0.6
-        assert pytest.approx(room.area, rel=1e-6) == expected_area
+        assert math.isclose(room.area, expected_area, rel_tol=1e-6)
 
     def test_room_volume(self):
         room = Room("DC04", 10, 8, 3.0, tile_size_xy=0.6)
         expected_volume = 10 * 0.6 * 8 * 0.6 * 3.0
-        assert pytest.approx(room.volume, rel=1e-6) == expected_volume
+        assert math.isclose(room.volume, expected_volume, rel_tol=1e-6)
 
 
 class TestDataRackPlacement:
     """Test adding DataRacks to rooms and multi-tile occupancy"""
 
-    def test_add_single_tile_rack(self):
-        room = Room("DC05", 10, 10, 3.0)
-        rack = DataRack("RACK01", 2, 3, 42, width_tiles=1, depth_tiles=1)
-        
-        result = room.add_data_rack(rack)
-        
-        assert result == True
-        assert len(room.data_racks) == 1
-        assert room.data_racks[0] == rack
-        assert room.is_tile_occupied(2, 3) == True
-
-    def test_add_multi_tile_rack_2x2(self):
-        room = Room("DC06", 10, 10, 3.0)
-        rack = DataRack("RACK02", 4, 5, 42, width_tiles=2, depth_tiles=2)
-        
-        result = room.add_data_rack(rack)
-        
-        assert result == True
-        assert len(room.data_racks) == 1
-        # Check all 4 tiles are occupied
-        assert room.is_tile_occupied(4, 5) == True
-        assert room.is_tile_occupied(5, 5) == True
-        assert room.is_tile_occupied(4, 6) == True
-        assert room.is_tile_occupied(5, 6) == True
-
-    def test_add_multi_tile_rack_3x1(self):
-        room = Room("DC07", 10, 10, 3.0)
-        rack = DataRack("RACK03", 1, 1, 20, width_tiles=3, depth_tiles=1)
-        
-        result = room.add_data_rack(rack)
-        
-        assert result == True
-        # Check all 3 tiles in a row are occupied
-        assert room.is_tile_occupied(1, 1) == True
-        assert room.is_tile_occupied(2, 1) == True
-        assert room.is_tile_occupied(3, 1) == True
-
-    def test_add_rack_out_of_bounds_fails(self):
-        room = Room("DC08", 5, 5, 3.0)
-        # Rack at (4, 4) with 2x2 footprint would go out of bounds
-        rack = DataRack("RACK04", 4, 4, 42, width_tiles=2, depth_tiles=2)
-        
-        result = room.add_data_rack(rack)
-        
-        assert result == False
+    @pytest.mark.parametrize(
+        "room_size,placements",
+        [
+            pytest.param((10, 10), [(2, 3, 1, 1, True)], id="single_tile"),
+            pytest.param((10, 10), [(4, 5, 2, 2, True)], id="2x2"),
+            pytest.param((10, 10), [(1, 1, 3, 1, True)], id="3x1"),
+            # (4, 4) with a 2x2 footprint would go out of bounds
+            pytest.param((5, 5), [(4, 4, 2, 2, False)], id="out_of_bounds"),
+            pytest.param((10, 10), [(3, 3, 2, 2, True), (4, 4, 2, 2, False)], id="overlap"),
+            pytest.param((10, 10), [(0, 0, 2, 2, True), (3, 0, 2, 2, True), (6, 0, 2, 2, True)], id="row"),
+        ],
+    )
+    def test_add_data_rack_placements(self, room_size, placements):
+        room = Room("DC05", *room_size, 3.0)
+        racks = [
+            DataRack(f"RACK{i + 1:02d}", x, y, 42, width_tiles=w, depth_tiles=d)
+            for i, (x, y, w, d, _) in enumerate(placements)
+        ]
+        expected = [ok for *_, ok in placements]
+
+        results = [room.add_data_rack(rack) for rack in racks]
+
+        assert results == expected
+        placed = [rack for rack, ok in zip(racks, expected) if ok]
+        assert room.data_racks == placed
+        assert int(room.tile_grid.sum()) == sum(w * d for _, _, w, d, ok in placements if ok)
+        # Every tile of every placed rack is occupied
+        assert all(room.is_tile_occupied(*tile) for rack in placed for tile in rack.get_tile_footprint())
+
+    def test_add_data_racks_batch(self):
+        room = Room("DC21", 5, 5, 3.0)
+        racks = [
+            DataRack("RACK20", 0, 0, 42, width_tiles=2, depth_tiles=2),
+            DataRack("RACK21", 1, 1, 42, width_tiles=2, depth_tiles=2),  # Overlaps RACK20
+            DataRack("RACK22", 4, 4, 42, width_tiles=2, depth_tiles=2),  # Out of bounds
+            DataRack("RACK23", 3, 0, 42, width_tiles=2, depth_tiles=2),
+        ]
+
+        result = room.add_data_racks(racks)
+
+        assert result == [True, False, False, True]
+        assert room.data_racks == [racks[0], racks[3]]
+        assert room.occupied_tile_count == 8
+
+    def test_add_data_racks_accepts_generator(self):
+        room = Room("DC28", 5, 5, 3.0)
+        result = room.add_data_racks(DataRack(f"RACK{i + 27}", i * 2, 0, 42) for i in range(3))
+        assert result == [True, True, True]
+        assert room.occupied_tile_count == 3
+
+    def test_add_data_racks_empty_batch(self):
+        room = Room("DC22", 5, 5, 3.0)
+        assert room.add_data_racks([]) == []
         assert len(room.data_racks) == 0
 
-    def test_add_rack_overlapping_fails(self):
-        room = Room("DC09", 10, 10, 3.0)
-        rack1 = DataRack("RACK05", 3, 3, 42, width_tiles=2, depth_tiles=2)
-        rack2 = DataRack("RACK06", 4, 4, 42, width_tiles=2, depth_tiles=2)
-        
-        result1 = room.add_data_rack(rack1)
-        result2 = room.add_data_rack(rack2)
-        
-        assert result1 == True
-        assert result2 == False  # Overlaps with rack1
-        assert len(room.data_racks) == 1
-
-    def test_add_multiple_non_overlapping_racks(self):
-        room = Room("DC10", 10, 10, 3.0)
-        rack1 = DataRack("RACK07", 0, 0, 42, width_tiles=2, depth_tiles=2)
-        rack2 = DataRack("RACK08", 3, 0, 42, width_tiles=2, depth_tiles=2)
-        rack3 = DataRack("RACK09", 6, 0, 42, width_tiles=2, depth_tiles=2)
-        
-        result1 = room.add_data_rack(rack1)
-        result2 = room.add_data_rack(rack2)
-        result3 = room.add_data_rack(rack3)
-        
-        assert result1 == True
-        assert result2 == True
-        assert result3 == True
-        assert len(room.data_racks) == 3
-
 
 class TestTileOccupancy:
     """Test tile occupancy queries"""
@@ -131,16 +125,19 @@ class TestTileOccupancy:
         occupied = room.get_occupied_tiles()
         assert len(occupied) == 0
 
-    def test_get_occupied_tiles_after_rack_placement(self):
-        room = Room("DC12", 10, 10, 3.0)
+    def test_get_occupied_tiles_after_rack_placement(self, room10):
+        room = room10
         rack = DataRack("RACK10", 2, 3, 42, width_tiles=2, depth_tiles=3)
         room.add_data_rack(rack)
         
         occupied = room.get_occupied_tiles()
-        expected = [(2, 3), (2, 4), (2, 5), (3, 3), (3, 4), (3, 5)]
         
         assert len(occupied) == 6
-        assert set(occupied) == set(expected)
+        assert frozenset(occupied) == _EXPECTED_2x3
+        assert room.occupied_tile_count == 6
+        assert all(type(coord) is int for tile in occupied for coord in tile)
+        assert room.is_tile_occupied(2, 3) is True
+        assert room.is_tile_occupied(0, 0) is False
 
     def test_get_unoccupied_tiles(self):
         room = Room("DC13", 3, 3, 3.0)
@@ -149,5 +146,79 @@ class TestTileOccupancy:
         
         unoccupied = room.get_unoccupied_tiles()
         
-        assert len(unoccupied) == 8  # 9 total - 1 occupied
-        assert (0, 0) not in unoccupied
+        assert len(unoccupied) == 8  # 9 total - 1 occupied, and no duplicates
+        assert frozenset(unoccupied) == _ALL_3x3 - {(0, 0)}
+
+    def test_obstacle_footprint_matches_stamped_tiles(self):
+        room = Room("DC27", 5, 5, 3.0)
+        obstacle = Obstacle("OBS21", 1, 1, width_tiles=2, depth_tiles=2)
+        obstacle.width_tiles = 3
+        room.add_obstacle(obstacle)
+        assert room.get_occupied_tiles() == obstacle.get_tile_footprint()
+        assert obstacle.get_tile_bounds() == (1, 1, 3, 2)
+
+    def test_get_occupied_tiles_refreshed_after_changes(self):
+        room = Room("DC24", 5, 5, 3.0)
+        rack = DataRack("RACK26", 0, 0, 42, width_tiles=1, depth_tiles=1)
+        obstacle = Obstacle("OBS20", 2, 2)
+        assert room.get_occupied_tiles() == []
+
+        room.add_data_rack(rack)
+        assert room.get_occupied_tiles() == [(0, 0)]
+        room.add_obstacle(obstacle)
+        assert room.get_occupied_tiles() == [(0, 0), (2, 2)]
+        room.remove_data_rack(rack)
+        assert room.get_occupied_tiles() == [(2, 2)]
+
+
+class TestFreePlacementSearch:
+    """Test searching for a free footprint position"""
+
+    def test_find_free_placement_empty_room(self):
+        room = Room("DC18", 5, 5, 3.0)
+        assert room.find_free_placement(2, 2) == (0, 0)
+
+    def test_find_free_placement_skips_occupied_tiles(self):
+        room = Room("DC19", 4, 4, 3.0)
+        room.add_data_rack(DataRack("RACK17", 0, 0, 42, width_tiles=2, depth_tiles=4))
+
+        position = room.find_free_placement(2, 2)
+
+        assert position == (2, 0)
+        assert room.add_data_rack(DataRack("RACK18", *position, 42, width_tiles=2, depth_tiles=2)) == True
+
+    def test_find_free_placement_no_space(self):
+        room = Room("DC20", 3, 3, 3.0)
+        room.add_data_rack(DataRack("RACK19", 1, 1, 42))
+        assert room.find_free_placement(2, 2) is None
+        assert room.find_free_placement(4, 1) is None
+
+
+class TestRackRemoval:
+    """Test removing DataRacks frees their tiles"""
+
+    def test_remove_rack_frees_tiles(self, room10):
+        room = room10
+        rack = DataRack("RACK12", 4, 4, 42, width_tiles=2, depth_tiles=2)
+        room.add_data_rack(rack)
+
+        assert room.remove_data_rack(rack) == True
+        assert len(room.data_racks) == 0
+        assert room.get_occupied_tiles() == []
+        assert room.is_tile_occupied(4, 4) == False
+        assert room.occupied_tile_count == 0
+
+    def test_tiles_reusable_after_removal(self, room10):
+        room = room10
+        rack1 = DataRack("RACK13", 3, 3, 42, width_tiles=2, depth_tiles=2)
+        rack2 = DataRack("RACK14", 4, 4, 42, width_tiles=2, depth_tiles=2)
+        room.add_data_rack(rack1)
+        room.remove_data_rack(rack1)
+
+        assert room.add_data_rack(rack2) == True
+        assert frozenset(room.get_occupied_tiles()) == _EXPECTED_2x2_AT_4_4
+
+    def test_remove_unknown_rack_fails(self):
+        room = Room("DC16", 5, 5, 3.0)
+        rack = DataRack("RACK15", 0, 0, 42)
+        assert room.remove_data_rack(rack) == False